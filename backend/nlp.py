@@ -3,15 +3,24 @@ import os
 import re
 import sys
 import json
+import copy
+import bisect
+import math
+import hashlib
+import sqlite3
+import functools
+import itertools
+import threading
 import traceback
-from typing import List, Dict, Tuple, Optional, Set
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Tuple, Optional, Set, Sequence, Iterator
 from nltk.tokenize import sent_tokenize
 import nltk
 # Third-party imports
 import spacy
+from spacy.symbols import POS, VERB, NOUN, ADJ
 import groq
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
 
 # Initialize logging
@@ -19,69 +28,448 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Control characters stripped by clean_text/format_clause_text:
+# [\x00-\x08\x0B\x0C\x0E-\x1F\x7F-\xFF]
+_CONTROL_CHARS = [*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), *range(0x7F, 0x100)]
+_CONTROL_BYTES = bytes(c for c in _CONTROL_CHARS if c < 0x80)
+_CONTROL_CHAR_TABLE = dict.fromkeys(_CONTROL_CHARS)
+
+def _strip_control_chars(text: str) -> str:
+    """Remove control characters, using a byte-level delete table for ASCII text"""
+    if text.isascii():
+        return text.encode('ascii').translate(None, _CONTROL_BYTES).decode('ascii')
+    return text.translate(_CONTROL_CHAR_TABLE)
+
+def _normalized_digest(text: str) -> bytes:
+    """Digest of text with whitespace runs collapsed, used to key text comparisons"""
+    return hashlib.blake2b(' '.join(text.split()).encode('utf-8'), digest_size=16).digest()
+
+_NON_DIGITS = re.compile(r'\D+')
+
+# Digit runs kept as separate chunks by natural_sort_key
+_NATURAL_SORT_RE = re.compile(r'([0-9]+)')
+
+def _digits_value(value: str) -> float:
+    """Number formed by the digits of a string, or NaN when it has none"""
+    digits = _NON_DIGITS.sub('', value)
+    return float(digits) if digits else float('nan')
+
+@functools.lru_cache(maxsize=4096)
+def _percent_difference(original: str, new: str) -> str:
+    """Signed percentage change between the digits of two values, or 'N/A'"""
+    orig_num = _digits_value(original)
+    new_num = _digits_value(new)
+    if math.isnan(orig_num) or math.isnan(new_num) or orig_num == 0:
+        return "N/A"
+    return f"{(new_num - orig_num) / orig_num * 100:+.1f}%"
+
+def _best_relative_similarity(values1: np.ndarray, values2: np.ndarray) -> np.ndarray:
+    """For each of values1, the best 1 - |a - b| / max(a, b) against values2.
+
+    NaN entries never match; two zeros count as identical.
+    """
+    a = values1[:, np.newaxis]
+    b = values2[np.newaxis, :]
+    denominator = np.maximum(a, b)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        similarity = np.where(denominator > 0, 1.0 - np.abs(a - b) / denominator, 1.0)
+    similarity = np.where(np.isnan(a) | np.isnan(b), 0.0, similarity)
+    return similarity.max(axis=1)
+
+def _select_best_matches(scores: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Column index and value of the first maximum in each row of a score matrix"""
+    if scores.shape[1] == 0:
+        return np.zeros(scores.shape[0], dtype=np.intp), np.zeros(scores.shape[0])
+    best_indices = scores.argmax(axis=1)
+    return best_indices, scores[np.arange(scores.shape[0]), best_indices]
+
+# Lower bounds of each comparison status; a score equal to a bound gets
+# the higher label
+_STATUS_THRESHOLDS = (50, 70, 85, 95)
+_STATUS_LABELS = (
+    'Substantially Different',
+    'Significantly Different',
+    'Similar with Notable Changes',
+    'Very Similar',
+    'Nearly Identical',
+)
+
+# Expected clauses scored per block in compare_contracts; bounds the
+# semantic tile and retained pair results to _SIMILARITY_BLOCK rows
+_SIMILARITY_BLOCK = 128
+
+# Texts per forward pass of the sentence embedding model
+_ENCODE_BATCH_SIZE = 64
+
+# Part of every CLAUSE_SCORE_CACHE_PATH score key; bump it whenever
+# compare_texts scoring or its result layout changes so stale rows are
+# never served
+_SCORE_CACHE_VERSION = 1
+
+# Texts per nlp.pipe batch, and the spaCy components entity lookups do
+# not need (entity_ruler patterns match on POS, so the tagger stays)
+_SPACY_BATCH_SIZE = 64
+_NER_DISABLED_PIPES = ('parser', 'lemmatizer')
+
+def _phrase_patterns(token_patterns: List[Dict]) -> Optional[List[str]]:
+    """Lowercase phrases equivalent to a token pattern that only constrains LOWER.
+
+    Such patterns can go to the entity ruler's PhraseMatcher instead of its
+    token Matcher; any other pattern returns None.
+    """
+    alternatives = []
+    for token in token_patterns:
+        if set(token) != {'LOWER'}:
+            return None
+        value = token['LOWER']
+        if isinstance(value, str):
+            alternatives.append((value,))
+        elif isinstance(value, dict) and set(value) == {'IN'}:
+            alternatives.append(tuple(value['IN']))
+        else:
+            return None
+    return [' '.join(words) for words in itertools.product(*alternatives)]
+
+def _ruler_patterns(entity_patterns: Dict[str, List[Dict]]) -> List[Dict]:
+    """Entity ruler patterns for all domains.
+
+    Token patterns with a LIKE_NUM token are left out (numbers are handled by
+    the numeric regexes); lowercase-only patterns become phrase patterns.
+    """
+    patterns = []
+    for domain_patterns in entity_patterns.values():
+        for pattern in domain_patterns:
+            token_patterns = pattern['pattern']
+            if not isinstance(token_patterns, list):
+                patterns.append(pattern)
+                continue
+            if any(token.get('LIKE_NUM') for token in token_patterns):
+                continue
+            phrases = _phrase_patterns(token_patterns)
+            if phrases is None:
+                patterns.append(pattern)
+            else:
+                patterns.extend({'label': pattern['label'], 'pattern': phrase} for phrase in phrases)
+    return patterns
+
+# Best-match score bounds for partial and exact clause matches, and the
+# compare_contracts result list each band is collected in
+_MATCH_THRESHOLDS = np.array([70.0, 90.0])
+_MATCH_CATEGORIES = ('mismatches', 'partial_matches', 'matches')
+
+# Component scores of _calculate_component_scores and their weights in
+# _calculate_final_scores: legal terms have the highest weight, numeric
+# values and obligations are equally important, semantic similarity lowest
+_COMPONENT_SCORE_NAMES = ('legal_term_score', 'numeric_score', 'obligation_score', 'semantic_score')
+_COMPONENT_SCORE_WEIGHTS = np.array([0.35, 0.25, 0.25, 0.15])
+
+# Numeric values compared between clauses by _compare_numeric_values
+_CLAUSE_NUMERIC_RE = re.compile(
+    r'(?P<amount>(?:USD|€|£|\$)\s*\d+(?:,\d{3})*(?:\.\d{2})?)|'
+    r'(?P<percentage>\d+(?:\.\d+)?%)|'
+    r'(?P<duration>\d+\s*(?:day|week|month|year)s?)|'
+    r'(?P<date>\d{1,2}[-/]\d{1,2}[-/]\d{2,4})'
+)
+
+def _index_by_expected_number(matches: List[Dict]) -> Dict:
+    """Map each expected clause number to its first match record"""
+    by_number = {}
+    for match in matches:
+        by_number.setdefault(match['expected_clause']['number'], match)
+    return by_number
+
+# Risk points per High severity change of each kind in a partial match
+_PARTIAL_CHANGE_RISK_WEIGHTS = (
+    ('numeric_changes', 15),
+    ('structural_changes', 10),
+    ('content_changes', 15),
+)
+
+# Parts of speech that make up a sentence pattern
+_PATTERN_POS_NAMES = {VERB: 'VERB', NOUN: 'NOUN', ADJ: 'ADJ'}
+_PATTERN_POS_IDS = np.array(list(_PATTERN_POS_NAMES), dtype=np.uint64)
+
+# Sort rank of each recommendation priority
+_PRIORITY_ORDER = {'High': 0, 'Medium': 1, 'Low': 2}
+
+_FINANCIAL_VALUE_TYPES = frozenset(('money', 'percentage'))
+_TIMELINE_VALUE_TYPES = frozenset(('date', 'duration'))
+
+# Clause-level numeric types whose changes are reported with High severity
+_HIGH_SEVERITY_VALUE_TYPES = frozenset(('amount', 'percentage'))
+
+# Legal terms reported by _extract_legal_terms and the phrases that signal them
+_LEGAL_TERM_SYNONYMS = {
+    'pursuant to': (
+        'according to', 'in accordance with', 'as per',
+        'in compliance with', 'under', 'following'
+    ),
+    'notwithstanding': (
+        'despite', 'regardless of', 'even if', 'although',
+        'in spite of', 'without regard to'
+    ),
+    'herein': (
+        'in this agreement', 'in this document',
+        'in these terms', 'contained herein'
+    ),
+    'termination': (
+        'terminate', 'cancel', 'end', 'discontinue',
+        'cease'
+    ),
+    'indemnification': (
+        'indemnify', 'hold harmless', 'defend',
+        'protect against', 'compensate'
+    ),
+    'confidentiality': (
+        'confidential', 'proprietary', 'non-disclosure',
+        'secret', 'private'
+    ),
+    'force majeure': (
+        'act of god', 'unforeseen circumstance',
+        'beyond control', 'unavoidable'
+    )
+}
+_LEGAL_TERM_BY_GROUP = {f'term{i}': term for i, term in enumerate(_LEGAL_TERM_SYNONYMS)}
+# One lookahead alternation with a group per term: tried at every position,
+# it finds every substring occurrence in a single pass over the text (no
+# phrase of one term is a prefix of another term's phrase)
+_LEGAL_SYNONYM_RE = re.compile('(?=' + '|'.join(
+    f'(?P<term{i}>' + '|'.join(re.escape(phrase) for phrase in (term,) + synonyms) + ')'
+    for i, (term, synonyms) in enumerate(_LEGAL_TERM_SYNONYMS.items())
+) + ')')
+
+# Currency amount in (lowercased) clause text
+_MONEY_AMOUNT_RE = re.compile(r'(?:USD|€|£|\$)\s*\d+', re.IGNORECASE)
+_CURRENCY_MARKERS = ('$', '€', '£', 'usd')
+
+
+def _has_money_amount(text_lower: str) -> bool:
+    """Whether lowercased text holds a currency amount"""
+    # Most clauses carry no currency marker, so plain substring tests
+    # settle them without running the regex
+    if not any(marker in text_lower for marker in _CURRENCY_MARKERS):
+        return False
+    return _MONEY_AMOUNT_RE.search(text_lower) is not None
+
+
+# Keywords that make an unexpected extra clause high risk
+_EXTRA_CLAUSE_KEYWORD_RE = re.compile(
+    'terminate|liability|indemnify|warrant|confidential|payment|intellectual property'
+)
+
+# Modal terms whose changes are flagged as High importance
+_HIGH_IMPORTANCE_TERMS = frozenset(('shall', 'must', 'will'))
+
+# Substrings checked by _determine_obligation_type and
+# validate_critical_clause; tuples because they are scanned in order as
+# substrings, not tested for membership
+_MANDATORY_TERMS = ('shall', 'must', 'will')
+_PERMISSIVE_TERMS = ('may', 'can', 'permitted')
+_RECOMMENDED_TERMS = ('should', 'recommended')
+_VALIDATION_OBLIGATION_TERMS = ('shall', 'must', 'will', 'agree')
+_AMBIGUOUS_TERMS = ('may', 'might', 'could', 'should')
+_IMPRECISE_QUANTITY_TERMS = ('approximately', 'about', 'around')
+
+# Fixed fields of each recommendation produced by generate_recommendations
+_RECOMMENDATION_FIELDS = ('priority', 'category', 'title', 'action', 'impact')
+_RECOMMENDATION_TEMPLATES = {
+    'legal': ('High', 'Legal', 'Legal Term Modifications',
+              'Review with legal counsel',
+              'May affect legal obligations and rights'),
+    'financial': ('High', 'Financial', 'Financial Term Changes',
+                  'Verify all financial changes and their implications',
+                  'Direct monetary impact'),
+    'timeline': ('Medium', 'Timeline', 'Timeline Modifications',
+                 'Review all timeline changes and their feasibility',
+                 'May affect project schedules and deadlines'),
+    'obligations': ('High', 'Obligations', 'Changed Obligations',
+                    'Review all modified obligations and responsibilities',
+                    'May affect party responsibilities and requirements'),
+    'risk': ('High', 'Risk', 'High Risk Changes Detected',
+             'Conduct thorough legal and financial review',
+             'Multiple changes may have cumulative risk impact'),
+    'general': ('Low', 'General', 'Minor Changes',
+                'Standard review recommended',
+                'Minimal impact expected'),
+}
+
+def _build_recommendation(kind: str, description: str, details) -> Dict:
+    """Fill a recommendation template with its description and details"""
+    recommendation = dict(zip(_RECOMMENDATION_FIELDS, _RECOMMENDATION_TEMPLATES[kind]))
+    recommendation['description'] = description
+    recommendation['details'] = details
+    return recommendation
+
+# Numeric value types reported by _extract_numeric_changes
+_NUMERIC_CHANGE_PATTERNS = tuple(
+    (value_type, re.compile(pattern, re.IGNORECASE))
+    for value_type, pattern in (
+        ('amount', r'\$\d+(?:,\d{3})*(?:\.\d{2})?'),
+        ('percentage', r'\d+(?:\.\d+)?%'),
+        ('duration', r'\d+\s*(?:day|week|month|year)s?'),
+        ('time', r'\d{1,2}:\d{2}\s*(?:am|pm)'),
+    )
+)
+
+# Key legal and business terms checked by _analyze_key_terms
+_KEY_TERMS = (
+    ('obligation', ('shall', 'must', 'will', 'agrees to')),
+    ('prohibition', ('shall not', 'must not', 'will not', 'may not')),
+    ('permission', ('may', 'is permitted to', 'is allowed to')),
+    ('condition', ('if', 'provided that', 'subject to', 'conditional upon')),
+    ('time', ('immediately', 'promptly', 'within', 'by')),
+)
+_HIGH_SEVERITY_TERM_TYPES = frozenset(('obligation', 'prohibition'))
+
+# Critical clause types found by _extract_critical_clauses, in scan order
+_CRITICAL_CLAUSE_PATTERNS = tuple(
+    (clause_type, tuple(re.compile(pattern, re.IGNORECASE) for pattern in patterns))
+    for clause_type, patterns in (
+        ('termination', (
+            r'(?:right|ability)\s+to\s+terminate',
+            r'termination\s+(?:for|with)\s+cause',
+            r'immediate\s+termination'
+        )),
+        ('liability', (
+            r'limitation\s+of\s+liability',
+            r'liability\s+cap',
+            r'indemnification'
+        )),
+        ('payment', (
+            r'payment\s+terms?',
+            r'fee\s+structure',
+            r'pricing'
+        )),
+        ('confidentiality', (
+            r'confidential\s+information',
+            r'non[-\s]?disclosure',
+            r'trade\s+secrets?'
+        )),
+        ('intellectual_property', (
+            r'intellectual\s+property',
+            r'\bip\s+rights?',
+            r'ownership\s+of\s+(?:work|materials|deliverables)'
+        )),
+    )
+)
+
 # Download required NLTK data
 def download_nltk_data():
-    """Download required NLTK data with error handling"""
-    try:
-        # Download both punkt and punkt_tab
-        nltk.download('punkt', quiet=True)
-        nltk.download('punkt_tab', quiet=True)
+    """Download the NLTK sentence tokenizer data if it is not installed yet.
+
+    Raises RuntimeError when a download fails; nltk.download reports
+    failures through its return value rather than an exception.
+    """
+    missing = []
+    for resource in ('punkt', 'punkt_tab'):
+        try:
+            nltk.data.find(f'tokenizers/{resource}')
+        except LookupError:
+            missing.append(resource)
+    for resource in missing:
+        if not nltk.download(resource, quiet=True):
+            raise RuntimeError(f"Could not download NLTK resource '{resource}'")
+    if missing:
         logging.info("Successfully downloaded NLTK data")
-    except Exception as e:
-        logging.error(f"Error downloading NLTK data: {e}")
-        logging.error(traceback.format_exc())
-        # Create fallback tokenizer if download fails
-        global sent_tokenize
-        sent_tokenize = lambda text: text.split('.')
 
 # Download NLTK data on module import
 download_nltk_data()
 
-class ContractAnalyzer:
-    def __init__(self):
-        # Initialize Legal model for semantic similarity
-        try:
-            # Using InLegalBERT - trained on 42GB of legal documents including contracts
-            self.similarity_model = SentenceTransformer('law-ai/InLegalBERT')
-            logging.info("Successfully loaded Legal model")
-            
-            # Verify model is working
-            test_text = "This is a test sentence."
+@functools.lru_cache(maxsize=2048)
+def _tokenize_sentences(text: str) -> Tuple[str, ...]:
+    """Sentence-split a clause once; pairwise comparisons reuse the result"""
+    return tuple(sent_tokenize(text))
+
+# Models loaded once per process and shared by every ContractAnalyzer
+_shared_models: Dict[str, object] = {}
+_shared_models_lock = threading.Lock()
+
+
+def _get_spacy_pipeline():
+    """spaCy pipeline for NER, loaded (and downloaded if missing) on first use"""
+    with _shared_models_lock:
+        nlp = _shared_models.get('spacy')
+        if nlp is None:
             try:
-                _ = self.similarity_model.encode([test_text])[0]
-                logging.info("Legal model successfully verified")
+                nlp = spacy.load('en_core_web_sm')
+                logging.info("Successfully loaded spaCy model")
+            except OSError:
+                logging.warning("Downloading spaCy model...")
+                import subprocess
+                subprocess.check_call([sys.executable, "-m", "spacy", "download", "en_core_web_sm"])
+                nlp = spacy.load('en_core_web_sm')
+                logging.info("Successfully downloaded and loaded spaCy model")
             except Exception as e:
-                logging.error(f"Legal model verification failed: {e}")
+                logging.error(f"Error loading spaCy model: {e}")
                 raise
-                
-        except Exception as e:
-            logging.error(f"Error loading Legal model: {e}")
-            # Fallback to a smaller, general-purpose model if Legal model fails
-            try:
-                self.similarity_model = SentenceTransformer('all-MiniLM-L6-v2')
-                logging.warning("Falling back to MiniLM model")
-                
-                # Verify fallback model
-                test_text = "This is a test sentence."
-                _ = self.similarity_model.encode([test_text])[0]
-                logging.info("Fallback model successfully verified")
-            except Exception as e:
-                logging.error(f"Critical error: Both models failed to load: {e}")
-                raise RuntimeError("No similarity model available")
+            _shared_models['spacy'] = nlp
+        return nlp
+
+
+def _get_similarity_model():
+    """Sentence embedding model and its name, loaded on first use"""
+    with _shared_models_lock:
+        loaded = _shared_models.get('similarity')
+        if loaded is None:
+            loaded = _shared_models['similarity'] = _load_similarity_model()
+        return loaded
+
+
+def _load_similarity_model():
+    """Load the Legal model, falling back to a general-purpose model; returns (model, name)"""
+    from sentence_transformers import SentenceTransformer
+    
+    try:
+        # Using InLegalBERT - trained on 42GB of legal documents including contracts
+        similarity_model = SentenceTransformer('law-ai/InLegalBERT')
+        model_name = 'law-ai/InLegalBERT'
+        logging.info("Successfully loaded Legal model")
         
-        # Initialize spaCy NLP model for NER
+        # Verify model is working
+        test_text = "This is a test sentence."
         try:
-            self.nlp = spacy.load('en_core_web_sm')
-            logging.info("Successfully loaded spaCy model")
-        except OSError:
-            logging.warning("Downloading spaCy model...")
-            import subprocess
-            subprocess.check_call([sys.executable, "-m", "spacy", "download", "en_core_web_sm"])
-            self.nlp = spacy.load('en_core_web_sm')
-            logging.info("Successfully downloaded and loaded spaCy model")
+            _ = similarity_model.encode([test_text])[0]
+            logging.info("Legal model successfully verified")
         except Exception as e:
-            logging.error(f"Error loading spaCy model: {e}")
+            logging.error(f"Legal model verification failed: {e}")
             raise
+            
+    except Exception as e:
+        logging.error(f"Error loading Legal model: {e}")
+        # Fallback to a smaller, general-purpose model if Legal model fails
+        try:
+            similarity_model = SentenceTransformer('all-MiniLM-L6-v2')
+            model_name = 'all-MiniLM-L6-v2'
+            logging.warning("Falling back to MiniLM model")
+            
+            # Verify fallback model
+            test_text = "This is a test sentence."
+            _ = similarity_model.encode([test_text])[0]
+            logging.info("Fallback model successfully verified")
+        except Exception as e:
+            logging.error(f"Critical error: Both models failed to load: {e}")
+            raise RuntimeError("No similarity model available")
+    
+    # Half precision roughly doubles encoder throughput on GPU but shifts
+    # scores near the fixed match thresholds, so it is opt-in through
+    # SIMILARITY_MODEL_FP16
+    if similarity_model.device.type == 'cuda' and os.getenv('SIMILARITY_MODEL_FP16') == '1':
+        similarity_model.half()
+        # Cached scores and embeddings are keyed by name; keep fp16 results apart
+        model_name += ':fp16'
+        logging.info("Running similarity model in half precision")
+    
+    return similarity_model, model_name
+
+class ContractAnalyzer:
+    def __init__(self):
+        # Legal model for semantic similarity; loaded on first use so that
+        # importing and constructing the analyzer stays cheap
+        self._similarity_model = None
+        self._similarity_model_name = ''
+        
+        # spaCy NLP model for NER, shared between analyzers
+        self.nlp = _get_spacy_pipeline()
         
         # Initialize Groq client with proper error handling
         api_key = os.getenv('GROQ_API_KEY')
@@ -99,13 +487,8 @@ class ContractAnalyzer:
                 logging.error(f"Error initializing Groq client: {e}")
                 self.groq_client = None
 
-        # Initialize TF-IDF vectorizer for text comparison
-        from sklearn.feature_extraction.text import TfidfVectorizer
-        self.tfidf = TfidfVectorizer(
-            stop_words='english',
-            max_features=10000,
-            ngram_range=(1, 3)
-        )
+        # Hashed term vectorizer for text comparison, created on first use
+        self._tfidf = None
         
         
         # Compile regex patterns for numeric matching
@@ -164,6 +547,26 @@ class ContractAnalyzer:
             )
         }
 
+        # Single-pass alternation over numeric_patterns; the matched type is
+        # reported by match.lastgroup
+        self._combined_numeric_re = re.compile('|'.join(
+            f'(?P<{value_type}>{pattern.pattern})'
+            for value_type, pattern in self.numeric_patterns.items()
+        ))
+
+        # Numeric patterns used for similarity scoring, combined the same way.
+        # Alternatives are tried in order, so dates precede plain quantities.
+        similarity_numeric_patterns = {
+            'amount': r'\$\s*[\d,]+(?:\.\d{2})?|\d+(?:,\d{3})*(?:\.\d{2})?\s*(?:dollars?|USD)',
+            'percentage': r'\d+(?:\.\d+)?\s*%',
+            'date': r'\b\d{1,2}[-/]\d{1,2}[-/]\d{2,4}\b|\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4}\b',
+            'quantity': r'\b\d+(?:,\d{3})*\b(?!\s*%|\s*(?:dollars?|USD))'
+        }
+        self._similarity_numeric_re = re.compile('|'.join(
+            f'(?P<{value_type}>{pattern})'
+            for value_type, pattern in similarity_numeric_patterns.items()
+        ), re.IGNORECASE)
+
         # Enhanced domain keywords with more specific terms and subcategories
         self.domain_keywords = {
             'employment': {
@@ -437,6 +840,18 @@ class ContractAnalyzer:
             ]
         }
 
+        # Single alternation over all legal terms, longest first so that e.g.
+        # 'shall not' wins over 'shall'. Terms that are whole-word prefixes of
+        # the matched term are reported at the same position as well.
+        self._combined_legal_re = re.compile(r'\b(' + '|'.join(
+            re.escape(term) for term in sorted(self.legal_term_normalizations, key=len, reverse=True)
+        ) + r')\b')
+        self._legal_term_prefixes = {
+            term: [other for other in self.legal_term_normalizations
+                   if other != term and re.match(r'\b' + re.escape(other) + r'\b', term)]
+            for term in self.legal_term_normalizations
+        }
+
         # Add domain-specific entity patterns for spaCy
         self.entity_patterns = {
             'employment': [
@@ -548,15 +963,37 @@ class ContractAnalyzer:
 
         # Add entity patterns to spaCy pipeline
         if 'entity_ruler' not in self.nlp.pipe_names:
-            ruler = self.nlp.add_pipe('entity_ruler', before='ner')
-            patterns = []
-            for domain_patterns in self.entity_patterns.values():
-                for pattern in domain_patterns:
-                    # Skip patterns with LIKE_NUM
-                    if isinstance(pattern['pattern'], list) and any('LIKE_NUM' in token for token in pattern['pattern']):
-                        continue
-                    patterns.append(pattern)
-            ruler.add_patterns(patterns)
+            # Patterns that only match lowercased words are expanded into
+            # phrases for the ruler's PhraseMatcher, which looks them up by
+            # token hash instead of checking each token pattern
+            ruler = self.nlp.add_pipe('entity_ruler', before='ner', config={'phrase_matcher_attr': 'LOWER'})
+            ruler.add_patterns(_ruler_patterns(self.entity_patterns))
+
+        # Per-domain lookup tables for detect_domain_with_ner: entity labels
+        # as sets, and the lowercased domain_keywords entries it scans for
+        self._domain_entity_labels = {
+            domain: frozenset(pattern['label'] for pattern in patterns)
+            for domain, patterns in self.entity_patterns.items()
+        }
+        self._domain_keyword_terms = {
+            domain: tuple(keyword.lower() for keyword in keywords)
+            for domain, keywords in self.domain_keywords.items()
+        }
+
+        # Every domain keyword flattened into parallel arrays for score_domains;
+        # the keyword embeddings are computed on first use
+        self._domain_names = tuple(self.domain_keywords)
+        self._keyword_strings = []
+        keyword_domain_ids = []
+        for domain_id, subcategories in enumerate(self.domain_keywords.values()):
+            for keywords in subcategories.values():
+                self._keyword_strings.extend(sys.intern(keyword.lower()) for keyword in keywords)
+                keyword_domain_ids.extend([domain_id] * len(keywords))
+        self._keyword_domain_ids = np.array(keyword_domain_ids, dtype=np.intp)
+        self._keyword_embeddings = None
+        # Optional directory for a frozen float16 copy of the keyword
+        # embeddings that later processes memory-map instead of re-encoding
+        self._keyword_embeddings_dir = os.getenv('KEYWORD_EMBEDDINGS_DIR')
 
         # Define critical clause patterns with enhanced categorization and importance levels
         self.critical_clause_patterns = {
@@ -665,9 +1102,9 @@ class ContractAnalyzer:
                     # Core IP terms
                     r'intellectual\s+property\s+(?:rights?|ownership)',
                     r'(?:patent|copyright|trademark)',
-                    r'(?:IP|IPR)\s+(?:rights?|ownership)',
+                    r'\b(?:IP|IPR)\s+(?:rights?|ownership)',
                     # Ownership and rights
-                    r'ownership\s+(?:of|&)\s+(?:IP|rights?|materials?)',
+                    r'ownership\s+(?:of|&)\s+(?:IP\b|rights?|materials?)',
                     r'rights?\s+(?:assignment|transfer)',
                     # License terms
                     r'license\s+(?:grant|terms?|rights?)',
@@ -676,7 +1113,7 @@ class ContractAnalyzer:
                     r'use\s+(?:restriction|limitation)',
                     r'prohibited\s+(?:use|activity)',
                     # Protection
-                    r'IP\s+protection',
+                    r'\bIP\s+protection',
                     r'infringement\s+(?:clause|protection)'
                 ],
                 'importance': 'High',
@@ -694,7 +1131,7 @@ class ContractAnalyzer:
                     # Mediation and arbitration
                     r'(?:mediation|arbitration)\s+(?:clause|provision|procedure)',
                     r'alternative\s+dispute\s+resolution',
-                    r'ADR\s+(?:clause|provision)',
+                    r'\bADR\s+(?:clause|provision)',
                     # Jurisdiction
                     r'governing\s+(?:law|jurisdiction)',
                     r'choice\s+of\s+(?:law|forum)',
@@ -733,6 +1170,10 @@ class ContractAnalyzer:
             }
         }
 
+        # Flattened critical clause patterns for is_critical_clause, compiled on first use
+        self._importance_levels = {'High': 3, 'Medium': 2, 'Low': 1}
+        self._critical_patterns = None
+
         # Update section patterns to match the actual document structure
         self.section_patterns = {
             'main_section': r'(?:^|\n)(\d+)\.\s*([^●\d]+?)(?=\s*●|\s*\d+\.|$)',  # Matches main sections with proper boundaries
@@ -758,6 +1199,125 @@ class ContractAnalyzer:
             r'covenants\s+to\s+\w+',
             r'pledges\s+to\s+\w+'
         ]
+        # Obligation patterns compiled once and scanned separately, since
+        # matches of different patterns may overlap ("shall will deliver"
+        # holds both 'shall will' and 'will deliver'); IGNORECASE replaces
+        # lowercasing the whole text first
+        self._obligation_res = tuple(
+            re.compile(pattern, re.IGNORECASE) for pattern in self.obligation_patterns
+        )
+
+        # Pool for per-clause rows in compare_contracts; released by close()
+        self._clause_executor = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
+
+        # LRU memo of compare_texts results keyed by normalized text digests
+        self._cmp_cache: OrderedDict = OrderedDict()
+        self._cmp_cache_lock = threading.Lock()
+        self._cmp_cache_size = 1024
+
+        # Unit-norm float32 clause embeddings keyed by normalized text digest
+        self._embedding_cache: Dict[bytes, np.ndarray] = {}
+        self._embedding_cache_size = 4096
+
+        # LRU memo of _analyze_clause_differences results keyed by exact
+        # clause text digests and entity sets
+        self._diff_cache: OrderedDict = OrderedDict()
+        self._diff_cache_lock = threading.Lock()
+        self._diff_cache_size = 1024
+
+        # Optional on-disk second level for the compare_texts and embedding
+        # memos so results survive restarts; enabled by setting
+        # CLAUSE_SCORE_CACHE_PATH. The connection has its own lock, and
+        # score rows are buffered and committed in batches (at the latest
+        # when compare_contracts finishes) instead of once per pair
+        self._score_db = None
+        self._score_db_lock = threading.Lock()
+        self._pending_scores: List[Tuple[bytes, str]] = []
+        self._pending_scores_limit = 256
+        score_cache_path = os.getenv('CLAUSE_SCORE_CACHE_PATH')
+        if score_cache_path:
+            try:
+                self._score_db = sqlite3.connect(score_cache_path, check_same_thread=False)
+                # A cache can be rebuilt, so trade commit durability for speed
+                self._score_db.execute('PRAGMA journal_mode=WAL')
+                self._score_db.execute('PRAGMA synchronous=NORMAL')
+                self._score_db.execute(
+                    'CREATE TABLE IF NOT EXISTS clause_scores (key BLOB PRIMARY KEY, result TEXT NOT NULL)'
+                )
+                self._score_db.execute(
+                    'CREATE TABLE IF NOT EXISTS clause_embeddings (key BLOB PRIMARY KEY, embedding BLOB NOT NULL)'
+                )
+                self._score_db.commit()
+                logging.info(f"Using clause score cache at {score_cache_path}")
+            except sqlite3.Error as e:
+                logging.error(f"Error opening clause score cache: {e}")
+                self._score_db = None
+
+        # Lazily compiled whole-word patterns used by _get_term_context
+        self._term_ctx_cache: Dict[str, re.Pattern] = {}
+
+        # Part-of-speech patterns of already tagged sentences
+        self._pattern_cache: Dict[str, str] = {}
+        self._pattern_cache_size = 8192
+
+        # Legal terms, obligations and critical-clause classifications already
+        # computed per clause text; the scoring, difference and critical
+        # analysis passes revisit the same texts repeatedly
+        self._legal_terms_cache: Dict[str, frozenset] = {}
+        self._obligations_cache: Dict[str, Tuple[Dict, ...]] = {}
+        self._critical_cache: Dict[str, Tuple[bool, str, str]] = {}
+        self._obligation_signature_cache: Dict[str, Tuple[str, ...]] = {}
+        self._legal_context_cache: Dict[str, Tuple[Dict, ...]] = {}
+        self._numeric_values_cache: Dict[str, Tuple[Dict, ...]] = {}
+        self._critical_clauses_cache: Dict[str, Tuple[Dict, ...]] = {}
+        self._extraction_cache_size = 4096
+
+        # Per-clause and per-pair trace logging in compare_contracts
+        self.debug = False
+
+        # Worker processes for batched spaCy parsing; process start-up
+        # outweighs the gain on typical contracts, so this is opt-in
+        self.spacy_processes = 1
+
+    @property
+    def similarity_model(self):
+        """Sentence embedding model, loaded on first access and shared between analyzers"""
+        if self._similarity_model is None:
+            self._similarity_model, self._similarity_model_name = _get_similarity_model()
+        return self._similarity_model
+
+    @property
+    def _critical_patterns_compiled(self) -> List[Tuple[str, re.Pattern, str]]:
+        """(clause type, compiled pattern, importance) for every critical clause pattern"""
+        if self._critical_patterns is None:
+            compiled = []
+            for clause_type, info in self.critical_clause_patterns.items():
+                importance = info.get('importance', 'Low')
+                for pattern in info['patterns']:
+                    try:
+                        compiled.append((clause_type, re.compile(pattern, re.IGNORECASE), importance))
+                    except re.error:
+                        logger.error(f"Invalid regex pattern in critical_clause_patterns: {pattern}")
+            self._critical_patterns = compiled
+        return self._critical_patterns
+
+    @property
+    def tfidf(self):
+        """Stateless hashed term vectorizer for text comparison, created on first access
+
+        Needs no fit and keeps no vocabulary, so ``transform`` can be called
+        directly and the instance is safe to share across worker threads.
+        """
+        if self._tfidf is None:
+            from sklearn.feature_extraction.text import HashingVectorizer
+            self._tfidf = HashingVectorizer(
+                stop_words='english',
+                ngram_range=(1, 3),
+                n_features=2 ** 18,
+                alternate_sign=False,
+                norm='l2'
+            )
+        return self._tfidf
 
     def safe_extract_clauses(self, text: str) -> List[Dict]:
         """Safe wrapper for extract_clauses with error handling."""
@@ -823,21 +1383,23 @@ class ContractAnalyzer:
 
     def detect_domain_with_ner(self, text: str) -> Tuple[str, float]:
         """Detect contract domain using NER and keyword analysis."""
-        doc = self.nlp(text)
+        entities = self._entities(text)
         
         # Count domain-specific entities and keywords
         domain_scores = {domain: 0.0 for domain in self.domain_keywords.keys()}
         
         # NER scoring
-        for ent in doc.ents:
-            for domain, patterns in self.entity_patterns.items():
-                if any(pattern['label'] == ent.label_ for pattern in patterns):
+        for ent in entities:
+            label = ent.label_
+            for domain, labels in self._domain_entity_labels.items():
+                if label in labels:
                     domain_scores[domain] += 1.0
 
         # Keyword scoring
-        for domain, keywords in self.domain_keywords.items():
-            for keyword in keywords:
-                if keyword.lower() in text.lower():
+        text_lower = text.lower()
+        for domain, terms in self._domain_keyword_terms.items():
+            for term in terms:
+                if term in text_lower:
                     domain_scores[domain] += 0.5
 
         # Normalize scores
@@ -849,6 +1411,41 @@ class ContractAnalyzer:
         detected_domain = max(domain_scores.items(), key=lambda x: x[1])
         return detected_domain[0], detected_domain[1]
 
+    def score_domains(self, text: str) -> Dict[str, float]:
+        """Semantic relevance of text to each domain: summed keyword cosine similarities"""
+        if self._keyword_embeddings is None:
+            self._keyword_embeddings = self._load_keyword_embeddings()
+        query = self.embed([text])[0]
+        scores = np.bincount(
+            self._keyword_domain_ids,
+            weights=self._keyword_embeddings @ query,
+            minlength=len(self._domain_names)
+        )
+        return dict(zip(self._domain_names, scores.tolist()))
+
+    def _load_keyword_embeddings(self) -> np.ndarray:
+        """Domain keyword embeddings, memory-mapped from KEYWORD_EMBEDDINGS_DIR when set"""
+        if not self._keyword_embeddings_dir:
+            return self.embed(self._keyword_strings)
+        dim = self.similarity_model.get_sentence_embedding_dimension()
+        digest = hashlib.blake2b(
+            '\x00'.join([self._similarity_model_name, *self._keyword_strings]).encode('utf-8'),
+            digest_size=8
+        ).hexdigest()
+        path = os.path.join(self._keyword_embeddings_dir, f"kw_vecs.{digest}.fp16.bin")
+        shape = (len(self._keyword_strings), dim)
+        try:
+            if not os.path.exists(path):
+                vectors = self.embed(self._keyword_strings).astype(np.float16)
+                os.makedirs(self._keyword_embeddings_dir, exist_ok=True)
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                vectors.tofile(tmp_path)
+                os.replace(tmp_path, path)
+            return np.memmap(path, dtype=np.float16, mode='r', shape=shape)
+        except (OSError, ValueError) as e:
+            logging.error(f"Error using keyword embeddings file {path}: {e}")
+            return self.embed(self._keyword_strings)
+
     def get_domain_specific_prompt(self, domain: str, text: str) -> str:
         """
         Get domain-specific prompt for clause extraction.
@@ -979,17 +1576,28 @@ Make sure to extract ALL numbered sections from the document."""
             main_sections = list(re.finditer(self.section_patterns['main_section'], text))
             
             print(f"\nFound {len(main_sections)} main sections")
-            
-            # Process each main section
+
+            # Locate every main section and its sub-sections up front so all
+            # of their contents can be parsed by spaCy in one batch
+            sections = []
             for i, main_match in enumerate(main_sections):
-                section_number = main_match.group(1)
-                section_title = main_match.group(2).strip()
-                
                 # Get section content (up to next main section or end)
                 start_pos = main_match.end()
                 end_pos = main_sections[i + 1].start() if i + 1 < len(main_sections) else len(text)
                 section_content = text[start_pos:end_pos].strip()
-                
+                sub_sections = [
+                    (sub_match.group(1).strip(), sub_match.group(2).strip())
+                    for sub_match in re.finditer(self.section_patterns['sub_section'], section_content)
+                ]
+                sections.append((main_match.group(1), main_match.group(2).strip(), section_content, sub_sections))
+
+            docs = self._parse_batch(
+                [content for _, _, content, _ in sections] +
+                [sub_content for _, _, _, sub_sections in sections for _, sub_content in sub_sections]
+            )
+            
+            # Process each main section
+            for section_number, section_title, section_content, sub_sections in sections:
                 print(f"\nProcessing main section {section_number}: {section_title}")
                 print(f"Content length: {len(section_content)}")
                 
@@ -999,21 +1607,18 @@ Make sure to extract ALL numbered sections from the document."""
                     section_title,
                     section_content,
                     domain,
-                    confidence
+                    confidence,
+                    doc=docs.get(section_content)
                 )
                 
                 if main_clause:
                     main_clause['sub_clauses'] = []
                     validated_clauses.append(main_clause)
                     
-                    # Find sub-sections within this main section
-                    sub_matches = re.finditer(self.section_patterns['sub_section'], section_content)
+                    # Process sub-sections within this main section
                     sub_clauses = []
                     
-                    for sub_match in sub_matches:
-                        sub_title = sub_match.group(1).strip()
-                        sub_content = sub_match.group(2).strip()
-                        
+                    for sub_title, sub_content in sub_sections:
                         print(f"\nProcessing sub-section: {sub_title}")
                         print(f"Content length: {len(sub_content)}")
                         
@@ -1022,7 +1627,8 @@ Make sure to extract ALL numbered sections from the document."""
                             sub_title,
                             sub_content,
                             domain,
-                            confidence
+                            confidence,
+                            doc=docs.get(sub_content)
                         )
                         
                         if sub_clause:
@@ -1038,8 +1644,31 @@ Make sure to extract ALL numbered sections from the document."""
             print(f"Traceback: {traceback.format_exc()}")
             return []
 
-    def _process_clause(self, number: str, title: str, content: str, domain: str, confidence: float) -> Optional[Dict]:
-        """Process a single clause and return structured data."""
+    def _parse_batch(self, texts: List[str]) -> Dict[str, 'spacy.tokens.Doc']:
+        """Parse non-empty texts with one nlp.pipe call, keyed by text"""
+        unique_texts = list(dict.fromkeys(text for text in texts if text.strip()))
+        if not unique_texts:
+            return {}
+        # Callers read entities only, so the dependency parse and lemmas are skipped
+        disabled = [name for name in _NER_DISABLED_PIPES if name in self.nlp.pipe_names]
+        # Each text rides along as its Doc's context, keeping docs and keys paired
+        parsed = self.nlp.pipe(
+            ((text, text) for text in unique_texts), as_tuples=True,
+            batch_size=_SPACY_BATCH_SIZE, disable=disabled, n_process=self.spacy_processes
+        )
+        return {text: doc for doc, text in parsed}
+
+    def _entities(self, text: str) -> Tuple:
+        """Named entities of a single text, without the dependency parse"""
+        doc = self._parse_batch([text]).get(text)
+        return doc.ents if doc is not None else ()
+
+    def _process_clause(self, number: str, title: str, content: str, domain: str, confidence: float,
+                        doc: Optional['spacy.tokens.Doc'] = None) -> Optional[Dict]:
+        """Process a single clause and return structured data.
+
+        A Doc already parsed from content (see _parse_batch) may be passed in.
+        """
         try:
             print(f"\n=== Processing Clause {number} ===")
             print(f"Title: {title}")
@@ -1051,21 +1680,23 @@ Make sure to extract ALL numbered sections from the document."""
                 return None
             
             # Process with spaCy for entity extraction
-            doc = self.nlp(content)
-            entities = [{'text': ent.text, 'label': ent.label_} for ent in doc.ents]
+            ents = doc.ents if doc is not None else self._entities(content)
+            entities = [{'text': ent.text, 'label': ent.label_} for ent in ents]
             print(f"Found {len(entities)} entities")
             
             # Determine clause characteristics
             is_critical, clause_type, importance = self.is_critical_clause(content)
             print(f"Clause analysis: Critical={is_critical}, Type={clause_type}, Importance={importance}")
             
-            category = self.determine_clause_category(content, domain) or "General"
+            # Lowercased once for the category and validation keyword scans
+            content_lower = content.lower()
+            category = self.determine_clause_category(content, domain, content_lower) or "General"
             print(f"Determined category: {category}")
             
             # Validate critical clauses
             validation_status = None
             if is_critical:
-                validation_status = self.validate_critical_clause(content)
+                validation_status = self.validate_critical_clause(content, content_lower)
                 print(f"Critical clause validation: {validation_status}")
             
             clause_data = {
@@ -1121,18 +1752,21 @@ Make sure to extract ALL numbered sections from the document."""
             if not clauses:
                 return []
             
+            clauses = [clause for clause in clauses if isinstance(clause, dict) and 'text' in clause]
+            docs = self._parse_batch([clause['text'] for clause in clauses if isinstance(clause['text'], str)])
+
             validated_clauses = []
             for clause in clauses:
-                if isinstance(clause, dict) and 'text' in clause:
-                    processed_clause = self._process_clause(
-                        clause.get('number', str(len(validated_clauses) + 1)),
-                        clause.get('title', ''),
-                        clause['text'],
-                        domain,
-                        confidence * 0.8  # Lower confidence for LLM extraction
-                    )
-                    if processed_clause:
-                        validated_clauses.append(processed_clause)
+                processed_clause = self._process_clause(
+                    clause.get('number', str(len(validated_clauses) + 1)),
+                    clause.get('title', ''),
+                    clause['text'],
+                    domain,
+                    confidence * 0.8,  # Lower confidence for LLM extraction
+                    doc=docs.get(clause['text']) if isinstance(clause['text'], str) else None
+                )
+                if processed_clause:
+                    validated_clauses.append(processed_clause)
             
             return validated_clauses
             
@@ -1140,9 +1774,13 @@ Make sure to extract ALL numbered sections from the document."""
             print(f"Error in LLM extraction: {str(e)}")
             return []
 
-    def determine_clause_category(self, text: str, domain: str) -> Optional[str]:
-        """Determine clause category based on content and domain context."""
-        text_lower = text.lower()
+    def determine_clause_category(self, text: str, domain: str, text_lower: Optional[str] = None) -> Optional[str]:
+        """Determine clause category based on content and domain context.
+
+        text_lower may pass in text already lowercased by the caller.
+        """
+        if text_lower is None:
+            text_lower = text.lower()
         
         # Financial indicators
         if any(term in text_lower for term in ['payment', 'cost', 'fee', 'price', 'compensation', 'amount', '$']):
@@ -1179,8 +1817,11 @@ Make sure to extract ALL numbered sections from the document."""
         
         return None
 
-    def calculate_similarity_score(self, text1: str, text2: str) -> float:
-        """Calculate similarity score between legal texts with specialized legal term weighting"""
+    def calculate_similarity_score(self, text1: str, text2: str, semantic_score: Optional[float] = None) -> float:
+        """Calculate similarity score between legal texts with specialized legal term weighting.
+
+        A precomputed semantic score (0-100) may be passed to skip encoding.
+        """
         try:
             # Log input texts for debugging
             logging.info(f"Calculating similarity between texts:")
@@ -1208,9 +1849,9 @@ Make sure to extract ALL numbered sections from the document."""
             
             # 4. General Semantic Weight (15% of total score)
             logging.info("Calculating semantic similarity...")
-            embedding1 = self.similarity_model.encode([text1])[0]
-            embedding2 = self.similarity_model.encode([text2])[0]
-            semantic_score = float(cosine_similarity([embedding1], [embedding2])[0][0]) * 100
+            if semantic_score is None:
+                embedding1, embedding2 = self._encode_batch([text1, text2])
+                semantic_score = float(embedding1 @ embedding2) * 100
             logging.info(f"Semantic score: {semantic_score}")
             
             # Calculate weighted final score
@@ -1238,34 +1879,36 @@ Make sure to extract ALL numbered sections from the document."""
             logging.info(f"Text 1 (first 100 chars): {text1[:100]}")
             logging.info(f"Text 2 (first 100 chars): {text2[:100]}")
             
-            # Normalize both texts
-            text1 = self.normalize_legal_terms(text1.lower())
-            text2 = self.normalize_legal_terms(text2.lower())
+            # Normalize both texts (normalize_legal_terms lowercases them)
+            text1 = self.normalize_legal_terms(text1)
+            text2 = self.normalize_legal_terms(text2)
             
             # Extract legal terms and their context
             legal_terms1 = set()
             legal_terms2 = set()
             
-            # Check for critical legal phrases and their context
+            # Check for critical legal phrases and their context; a term counts
+            # only where it occurs as a whole word (_get_term_context returns ""
+            # otherwise), so 'sign' in "signature" is not a hit
             for term, variants in self.legal_term_normalizations.items():
                 # Check original term
-                if term in text1:
-                    context = self._get_term_context(text1, term)
+                context = self._get_term_context(text1, term)
+                if context:
                     legal_terms1.add((term, context))
                     logging.info(f"Found legal term in text1: {term} with context: {context}")
-                if term in text2:
-                    context = self._get_term_context(text2, term)
+                context = self._get_term_context(text2, term)
+                if context:
                     legal_terms2.add((term, context))
                     logging.info(f"Found legal term in text2: {term} with context: {context}")
                 
                 # Check variants
                 for variant in variants:
-                    if variant in text1:
-                        context = self._get_term_context(text1, variant)
+                    context = self._get_term_context(text1, variant)
+                    if context:
                         legal_terms1.add((term, context))
                         logging.info(f"Found variant in text1: {variant} -> {term} with context: {context}")
-                    if variant in text2:
-                        context = self._get_term_context(text2, variant)
+                    context = self._get_term_context(text2, variant)
+                    if context:
                         legal_terms2.add((term, context))
                         logging.info(f"Found variant in text2: {variant} -> {term} with context: {context}")
             
@@ -1312,16 +1955,12 @@ Make sure to extract ALL numbered sections from the document."""
             obligations1 = set()
             obligations2 = set()
             
-            for pattern in self.obligation_patterns:
-                matches1 = re.finditer(pattern, text1.lower())
-                matches2 = re.finditer(pattern, text2.lower())
-                
-                for match in matches1:
-                    obligations1.add(match.group())
-                    logging.info(f"Found obligation in text1: {match.group()}")
-                for match in matches2:
-                    obligations2.add(match.group())
-                    logging.info(f"Found obligation in text2: {match.group()}")
+            for match in self._obligation_matches(text1):
+                obligations1.add(match.group().lower())
+                logging.info(f"Found obligation in text1: {match.group()}")
+            for match in self._obligation_matches(text2):
+                obligations2.add(match.group().lower())
+                logging.info(f"Found obligation in text2: {match.group()}")
             
             logging.info(f"Found {len(obligations1)} obligations in text1")
             logging.info(f"Found {len(obligations2)} obligations in text2")
@@ -1332,10 +1971,14 @@ Make sure to extract ALL numbered sections from the document."""
             
             total_obligations = max(len(obligations1), len(obligations2))
             
-            logging.info(f"Matching obligations: {len(obligations1.intersection(obligations2))}")
+            # Count the intersection by probing the larger set with the smaller
+            smaller, larger = sorted((obligations1, obligations2), key=len)
+            matching_obligations = sum(1 for obligation in smaller if obligation in larger)
+            
+            logging.info(f"Matching obligations: {matching_obligations}")
             logging.info(f"Total obligations: {total_obligations}")
             
-            final_score = (len(obligations1.intersection(obligations2)) / total_obligations) * 100 if total_obligations > 0 else 0.0
+            final_score = (matching_obligations / total_obligations) * 100 if total_obligations > 0 else 0.0
             logging.info(f"Final obligation similarity score: {final_score}")
             return final_score
             
@@ -1351,25 +1994,16 @@ Make sure to extract ALL numbered sections from the document."""
             logging.info(f"Text 1 (first 100 chars): {text1[:100]}")
             logging.info(f"Text 2 (first 100 chars): {text2[:100]}")
             
-            # Extract numeric patterns
-            patterns = {
-                'amount': r'\$\s*[\d,]+(?:\.\d{2})?|\d+(?:,\d{3})*(?:\.\d{2})?\s*(?:dollars?|USD)',
-                'percentage': r'\d+(?:\.\d+)?\s*%',
-                'quantity': r'\b\d+(?:,\d{3})*\b(?!\s*%|\s*(?:dollars?|USD))',
-                'date': r'\b\d{1,2}[-/]\d{1,2}[-/]\d{2,4}\b|\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4}\b'
-            }
-            
             matches1 = []
             matches2 = []
             
-            # Extract all numeric values with their types
-            for value_type, pattern in patterns.items():
-                for match in re.finditer(pattern, text1, re.IGNORECASE):
-                    matches1.append((value_type, match.group()))
-                    logging.info(f"Found numeric value in text1: {value_type} - {match.group()}")
-                for match in re.finditer(pattern, text2, re.IGNORECASE):
-                    matches2.append((value_type, match.group()))
-                    logging.info(f"Found numeric value in text2: {value_type} - {match.group()}")
+            # Extract all numeric values with their types in one pass per text
+            for match in self._similarity_numeric_re.finditer(text1):
+                matches1.append((match.lastgroup, match.group()))
+                logging.info(f"Found numeric value in text1: {match.lastgroup} - {match.group()}")
+            for match in self._similarity_numeric_re.finditer(text2):
+                matches2.append((match.lastgroup, match.group()))
+                logging.info(f"Found numeric value in text2: {match.lastgroup} - {match.group()}")
             
             logging.info(f"Found {len(matches1)} numeric values in text1")
             logging.info(f"Found {len(matches2)} numeric values in text2")
@@ -1390,37 +2024,22 @@ Make sure to extract ALL numbered sections from the document."""
                 'date': 0.1
             }
             
+            # Group values by type and score each group in one vectorized step
+            values1_by_type = {}
+            values2_by_type = {}
+            for value_type, value in matches1:
+                values1_by_type.setdefault(value_type, []).append(value)
+            for value_type, value in matches2:
+                values2_by_type.setdefault(value_type, []).append(value)
+            
             total_score = 0.0
             total_weight = 0.0
             
-            for type1, value1 in matches1:
-                best_match_score = 0.0
-                for type2, value2 in matches2:
-                    if type1 == type2:
-                        logging.info(f"Comparing {type1} values: {value1} vs {value2}")
-                        if type1 == 'date':
-                            # For dates, check exact match
-                            if value1 == value2:
-                                best_match_score = 1.0
-                                logging.info("Exact date match found")
-                            else:
-                                relative_diff = abs(float(value1.replace(',', '')) - float(value2.replace(',', ''))) / max(float(value1.replace(',', '')), float(value2.replace(',', '')))
-                                best_match_score = max(best_match_score, 1.0 - relative_diff)
-                                logging.info(f"Relative difference: {relative_diff}, match score: {best_match_score}")
-                    else:
-                        # For numeric values, calculate similarity based on relative difference
-                        num1 = float(''.join(filter(str.isdigit, value1.replace(',', ''))))
-                        num2 = float(''.join(filter(str.isdigit, value2.replace(',', ''))))
-                        if num1 == num2:
-                                best_match_score = 1.0
-                                logging.info("Exact numeric match found")
-                        else:
-                            relative_diff = abs(num1 - num2) / max(num1, num2)
-                            best_match_score = max(best_match_score, 1.0 - relative_diff)
-                            logging.info(f"Relative difference: {relative_diff}, match score: {best_match_score}")
-                
-                total_score += best_match_score * weights[type1]
-                total_weight += weights[type1]
+            for value_type, values1 in values1_by_type.items():
+                best_scores = self._best_numeric_matches(value_type, values1, values2_by_type.get(value_type, []))
+                logging.info(f"Best {value_type} match scores: {best_scores.tolist()}")
+                total_score += float(best_scores.sum()) * weights[value_type]
+                total_weight += len(values1) * weights[value_type]
             
             final_score = (total_score / total_weight * 100) if total_weight > 0 else 100.0
             logging.info(f"Final numeric similarity score: {final_score}")
@@ -1431,35 +2050,61 @@ Make sure to extract ALL numbered sections from the document."""
             logging.error(f"Traceback: {traceback.format_exc()}")
             return 0.0
 
+    def _best_numeric_matches(self, value_type: str, values1: List[str], values2: List[str]) -> np.ndarray:
+        """Best match score in [0, 1] for each of values1 among same-type values2"""
+        if not values2:
+            return np.zeros(len(values1))
+        if value_type == 'date':
+            # Dates only count when they match exactly
+            return np.array([1.0 if value in values2 else 0.0 for value in values1])
+        return _best_relative_similarity(
+            np.array([_digits_value(value) for value in values1]),
+            np.array([_digits_value(value) for value in values2])
+        )
+
     def _get_term_context(self, text: str, term: str, context_words: int = 5) -> str:
-        """Get surrounding context for a legal term"""
+        """Get surrounding context for the first whole-word occurrence of a legal term;
+        "" if the term does not occur as a whole word"""
         try:
-            words = text.split()
-            start = 0  # Initialize start with default value
-            end = 0    # Initialize end with default value
-            
-            for i, word in enumerate(words):
-                if term in word:
-                    start = max(0, i - context_words)
-                    end = min(len(words), i + context_words + 1)
-            return ' '.join(words[start:end])  # Use initialized values if term not found
+            if term not in text:
+                return ""
+            pattern = self._term_ctx_cache.get(term)
+            if pattern is None:
+                pattern = re.compile(r'(?<!\w)' + re.escape(term) + r'(?!\w)')
+                self._term_ctx_cache[term] = pattern
+
+            match = pattern.search(text)
+            if not match:
+                return ""
+            return self._get_span_context(text, match.start(), match.end(), context_words)
         except Exception as e:
             logging.error(f"Error getting term context: {str(e)}")
             return ""
 
+    def _get_span_context(self, text: str, start: int, end: int, context_words: int = 5) -> str:
+        """Words of text[start:end] plus context_words words on either side"""
+        # Word indices of the first and last word covered by the span
+        words = text.split()
+        first = len(text[:start].split())
+        if start > 0 and not text[start - 1].isspace():
+            first -= 1
+        last = len(text[:end].split()) - 1
+
+        return ' '.join(words[max(0, first - context_words):min(len(words), last + context_words + 1)])
+
     def _calculate_context_similarity(self, context1: str, context2: str) -> float:
         """Calculate similarity between two context strings"""
         try:
             if not context1 or not context2:
                 return 0.0
             
-            # Normalize text
-            words1 = set(word.lower() for word in context1.split())
-            words2 = set(word.lower() for word in context2.split())
+            # Normalize text (lowercase each string once, not each word)
+            words1 = set(context1.lower().split())
+            words2 = set(context2.lower().split())
             
             # Calculate Jaccard similarity with more lenient threshold
-            intersection = len(words1.intersection(words2))
-            union = len(words1.union(words2))
+            intersection = len(words1 & words2)
+            union = len(words1) + len(words2) - intersection
             
             # Add partial word matching for better real-world matching
             if union > 0:
@@ -1488,17 +2133,22 @@ Make sure to extract ALL numbered sections from the document."""
         numeric_values = []
         
         try:
-            # Check each numeric pattern
-            for value_type, pattern in self.numeric_patterns.items():
-                matches = pattern.finditer(text)
-                for match in matches:
-                    value = match.group()
-                    numeric_values.append({
-                        'type': value_type,
-                        'value': value,
-                        'context': self._get_term_context(text, value)
-                    })
+            cached = self._recall_extraction(self._numeric_values_cache, text)
+            if cached is not None:
+                return cached
+            
+            # Scan once for all numeric types
+            for match in self._combined_numeric_re.finditer(text):
+                value = match.group()
+                numeric_values.append({
+                    'type': match.lastgroup,
+                    'value': value,
+                    'context': self._get_term_context(text, value)
+                })
             
+            self._remember_extraction(
+                self._numeric_values_cache, text, tuple(dict(value) for value in numeric_values)
+            )
             return numeric_values
             
         except Exception as e:
@@ -1508,17 +2158,12 @@ Make sure to extract ALL numbered sections from the document."""
     def _is_similar_value(self, value1: str, value2: str, value_type: str) -> bool:
         """Check if two numeric values are similar based on their type"""
         try:
-            # Extract digits, handling empty strings
-            digits1 = ''.join(filter(str.isdigit, value1.replace(',', '')))
-            digits2 = ''.join(filter(str.isdigit, value2.replace(',', '')))
+            num1 = _digits_value(value1)
+            num2 = _digits_value(value2)
             
             # If either string has no digits, they can't be similar
-            if not digits1 or not digits2:
+            if np.isnan(num1) or np.isnan(num2):
                 return False
-                
-            # Convert to float now that we know we have digits
-            num1 = float(digits1)
-            num2 = float(digits2)
             
             if value_type == 'money':
                 # Allow 1% difference for monetary values
@@ -1536,18 +2181,127 @@ Make sure to extract ALL numbered sections from the document."""
             logging.error(f"Error comparing numeric values: {str(e)}")
             return False
 
-    def compare_texts(self, text1: str, text2: str) -> Dict:
-        """Compare two texts and return detailed similarity analysis"""
+    def embed(self, texts: List[str], batch_size: int = _ENCODE_BATCH_SIZE) -> np.ndarray:
+        """Unit-norm float32 embeddings of texts as an (N, D) matrix.
+
+        Cosine similarity between two embedding matrices is their product,
+        e.g. ``analyzer.embed(a) @ analyzer.embed(b).T``.
+        """
+        return self._encode_batch(texts, batch_size=batch_size)
+
+    def _encode_batch(self, texts: List[str], batch_size: int = _ENCODE_BATCH_SIZE) -> np.ndarray:
+        """Encode texts in one batch into an (N, D) matrix of unit-norm embeddings.
+
+        Texts that differ only in whitespace are encoded once and share a row;
+        embeddings are remembered per text so repeated clauses are not re-encoded.
+        """
+        if not texts:
+            return np.zeros((0, self.similarity_model.get_sentence_embedding_dimension()), dtype=np.float32)
+
+        cache = self._embedding_cache
+        digests = [_normalized_digest(text) for text in texts]
+        rows: Dict[bytes, np.ndarray] = {}
+        pending: Dict[bytes, str] = {}
+        for digest, text in zip(digests, texts):
+            if digest in rows or digest in pending:
+                continue
+            row = cache.get(digest)
+            if row is None:
+                pending[digest] = text
+            else:
+                rows[digest] = row
+
+        if pending and self._score_db is not None:
+            for digest, row in self._load_persistent_embeddings(list(pending)).items():
+                rows[digest] = cache[digest] = row
+                del pending[digest]
+
+        if pending:
+            import torch
+            # encode() sorts its inputs by length, so batches carry little padding;
+            # inference mode also skips autograd version and view tracking
+            with torch.inference_mode():
+                embeddings = self.similarity_model.encode(
+                    list(pending.values()), batch_size=batch_size, show_progress_bar=False,
+                    normalize_embeddings=True, convert_to_numpy=True
+                )
+            # Keep the similarity GEMM on the single-precision BLAS path
+            embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+            if len(cache) + len(pending) > self._embedding_cache_size:
+                cache.clear()
+            for digest, row in zip(pending, embeddings):
+                rows[digest] = cache[digest] = row
+            if self._score_db is not None:
+                self._store_persistent_embeddings(dict(zip(pending, embeddings)))
+
+        return np.stack([rows[digest] for digest in digests])
+
+    def _embedding_db_key(self, digest: bytes) -> bytes:
+        """On-disk key for a text digest; includes the model so fallbacks don't share vectors"""
+        self.similarity_model  # Make sure the model (and its name) is loaded
+        return hashlib.blake2b(
+            digest + b'\x00' + self._similarity_model_name.encode('utf-8'), digest_size=16
+        ).digest()
+
+    def _load_persistent_embeddings(self, digests: List[bytes]) -> Dict[bytes, np.ndarray]:
+        """Embeddings of the given text digests found in the on-disk cache"""
+        found: Dict[bytes, np.ndarray] = {}
+        try:
+            digest_of_key = {self._embedding_db_key(digest): digest for digest in digests}
+            db_keys = list(digest_of_key)
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(db_keys), 500):
+                chunk = db_keys[start:start + 500]
+                with self._score_db_lock:
+                    db_rows = self._score_db.execute(
+                        'SELECT key, embedding FROM clause_embeddings WHERE key IN (%s)' % ','.join('?' * len(chunk)),
+                        chunk
+                    ).fetchall()
+                for db_key, blob in db_rows:
+                    found[digest_of_key[db_key]] = np.frombuffer(blob, dtype=np.float32)
+        except sqlite3.Error as e:
+            logging.error(f"Error reading clause embedding cache: {e}")
+        return found
+
+    def _store_persistent_embeddings(self, embeddings: Dict[bytes, np.ndarray]) -> None:
+        """Record freshly computed embeddings in the on-disk cache"""
+        try:
+            payload = [
+                (self._embedding_db_key(digest), np.ascontiguousarray(row, dtype=np.float32).tobytes())
+                for digest, row in embeddings.items()
+            ]
+            with self._score_db_lock:
+                self._score_db.executemany(
+                    'INSERT OR REPLACE INTO clause_embeddings (key, embedding) VALUES (?, ?)', payload
+                )
+                self._score_db.commit()
+        except sqlite3.Error as e:
+            logging.error(f"Error writing clause embedding cache: {e}")
+
+    def compare_texts(self, text1: str, text2: str, semantic_score: Optional[float] = None) -> Dict:
+        """Compare two texts and return detailed similarity analysis.
+
+        A precomputed semantic score (0-100) may be passed to skip encoding.
+        """
         try:
-            # Calculate component scores first
+            # Texts that differ only in whitespace need no analysis; other
+            # pairs are memoized by digest
+            cache_key = (_normalized_digest(text1), _normalized_digest(text2))
+            if cache_key[0] == cache_key[1]:
+                return self._identical_text_result()
+            cached = self._get_cached_comparison(cache_key)
+            if cached is not None:
+                return cached
+
+            # Component scores (concurrency is per clause, in compare_contracts)
             legal_term_score = self._calculate_legal_term_similarity(text1, text2)
             obligation_score = self._calculate_obligation_similarity(text1, text2)
             numeric_score = self._calculate_numeric_similarity(text1, text2)
             
             # Calculate semantic score
-            embedding1 = self.similarity_model.encode([text1])[0]
-            embedding2 = self.similarity_model.encode([text2])[0]
-            semantic_score = float(cosine_similarity([embedding1], [embedding2])[0][0]) * 100
+            if semantic_score is None:
+                embedding1, embedding2 = self._encode_batch([text1, text2])
+                semantic_score = float(embedding1 @ embedding2) * 100
             
             # Calculate weighted final score
             similarity_score = (
@@ -1586,6 +2340,8 @@ Make sure to extract ALL numbered sections from the document."""
                 'differences': differences
             }
             
+            self._store_cached_comparison(cache_key, result)
+            
             return result
             
         except Exception as e:
@@ -1609,6 +2365,116 @@ Make sure to extract ALL numbered sections from the document."""
                 })
             }
 
+    def _persistent_cache_key(self, cache_key: Tuple[bytes, bytes]) -> bytes:
+        """On-disk key for a digest pair; includes the model so fallbacks don't share
+        scores, and the scoring version so upgrades don't read stale results"""
+        self.similarity_model  # Make sure the model (and its name) is loaded
+        return hashlib.blake2b(
+            cache_key[0] + b'\x00' + cache_key[1] + b'\x00' + self._similarity_model_name.encode('utf-8')
+            + b'\x00' + str(_SCORE_CACHE_VERSION).encode('ascii'),
+            digest_size=16
+        ).digest()
+
+    def _get_cached_comparison(self, cache_key: Tuple[bytes, bytes]) -> Optional[Dict]:
+        """Look up a compare_texts result in memory, then on disk"""
+        with self._cmp_cache_lock:
+            cached = self._cmp_cache.get(cache_key)
+            if cached is not None:
+                self._cmp_cache.move_to_end(cache_key)
+                return copy.deepcopy(cached)
+            if self._score_db is None:
+                return None
+        
+        try:
+            db_key = self._persistent_cache_key(cache_key)
+            with self._score_db_lock:
+                row = self._score_db.execute(
+                    'SELECT result FROM clause_scores WHERE key = ?', (db_key,)
+                ).fetchone()
+            if row is None:
+                return None
+            result = json.loads(row[0])
+        except (sqlite3.Error, json.JSONDecodeError) as e:
+            logging.error(f"Error reading clause score cache: {e}")
+            return None
+        
+        with self._cmp_cache_lock:
+            self._remember_comparison(cache_key, result)
+        return copy.deepcopy(result)
+
+    def close(self) -> None:
+        """Stop the clause worker pool and flush and close the on-disk score cache"""
+        self._clause_executor.shutdown(wait=True)
+        if self._score_db is not None:
+            self._flush_score_cache()
+            with self._score_db_lock:
+                self._score_db.close()
+                self._score_db = None
+
+    def _store_cached_comparison(self, cache_key: Tuple[bytes, bytes], result: Dict) -> None:
+        """Record a compare_texts result in memory and, if enabled, on disk"""
+        with self._cmp_cache_lock:
+            self._remember_comparison(cache_key, copy.deepcopy(result))
+        if self._score_db is None:
+            return
+        
+        try:
+            row = (self._persistent_cache_key(cache_key), json.dumps(result))
+        except (TypeError, ValueError) as e:
+            logging.error(f"Error writing clause score cache: {e}")
+            return
+        with self._score_db_lock:
+            self._pending_scores.append(row)
+            if len(self._pending_scores) >= self._pending_scores_limit:
+                self._write_pending_scores()
+
+    def _flush_score_cache(self) -> None:
+        """Commit buffered compare_texts results to the on-disk cache"""
+        if self._score_db is None:
+            return
+        with self._score_db_lock:
+            self._write_pending_scores()
+
+    def _write_pending_scores(self) -> None:
+        """Write and commit the buffered score rows; caller holds _score_db_lock"""
+        if not self._pending_scores:
+            return
+        rows, self._pending_scores = self._pending_scores, []
+        try:
+            self._score_db.executemany('INSERT OR REPLACE INTO clause_scores (key, result) VALUES (?, ?)', rows)
+            self._score_db.commit()
+        except sqlite3.Error as e:
+            logging.error(f"Error writing clause score cache: {e}")
+
+    def _remember_comparison(self, cache_key: Tuple[bytes, bytes], result: Dict) -> None:
+        """Insert into the in-memory LRU; caller holds _cmp_cache_lock"""
+        self._cmp_cache[cache_key] = result
+        self._cmp_cache.move_to_end(cache_key)
+        if len(self._cmp_cache) > self._cmp_cache_size:
+            self._cmp_cache.popitem(last=False)
+
+    def _identical_text_result(self) -> Dict:
+        """Result of compare_texts for texts that are identical up to whitespace"""
+        return {
+            'similarity_score': 100.0,
+            'component_scores': {
+                'legal_term_score': 100.0,
+                'numeric_score': 100.0,
+                'obligation_score': 100.0,
+                'semantic_score': 100.0
+            },
+            'differences': {
+                'legal_terms': {
+                    'added': [],
+                    'removed': [],
+                    'modified': []
+                },
+                'numeric_values': [],
+                'obligations': [],
+                'critical_changes': []
+            }
+        }
+
     def _determine_match_category(self, similarity_score: float, critical_issues: int) -> str:
         """Determine the match category based on similarity score and critical issues"""
         if similarity_score >= 95 and critical_issues == 0:
@@ -1691,16 +2557,22 @@ Make sure to extract ALL numbered sections from the document."""
 
     def _extract_legal_terms_with_context(self, text: str) -> List[Dict]:
         """Extract legal terms with their surrounding context"""
+        cached = self._recall_extraction(self._legal_context_cache, text)
+        if cached is not None:
+            return cached
+        
         terms = []
-        for term, variants in self.legal_term_normalizations.items():
-            for match in re.finditer(r'\b' + re.escape(term) + r'\b', text.lower()):
+        for match in self._combined_legal_re.finditer(text.lower()):
+            matched = match.group(1)
+            for term in [matched] + self._legal_term_prefixes[matched]:
                 start = max(0, match.start() - 50)  # Add context before
-                end = min(len(text), match.end() + 50)  # Add context after
+                end = min(len(text), match.start() + len(term) + 50)  # Add context after
                 terms.append({
                     'term': term,
                     'context': text[start:end],
                     'position': match.start()
                 })
+        self._remember_extraction(self._legal_context_cache, text, tuple(dict(term) for term in terms))
         return terms
 
     def _compare_legal_terms(self, terms1: List[Dict], terms2: List[Dict]) -> float:
@@ -1744,14 +2616,20 @@ Make sure to extract ALL numbered sections from the document."""
     def _find_modified_terms(self, terms1: List[Dict], terms2: List[Dict]) -> List[Dict]:
         """Find terms that exist in both texts but with different context"""
         modified = []
+        
+        # Index the second text's contexts by term so each term only meets
+        # occurrences of the same term
+        contexts2 = {}
+        for term2 in terms2:
+            contexts2.setdefault(term2['term'], []).append(term2['context'])
+        
         for term1 in terms1:
-            for term2 in terms2:
-                if (term1['term'] == term2['term'] and 
-                    term1['context'] != term2['context']):
+            for context2 in contexts2.get(term1['term'], []):
+                if term1['context'] != context2:
                     modified.append({
                         'term': term1['term'],
                         'original_context': term1['context'],
-                        'new_context': term2['context']
+                        'new_context': context2
                     })
         return modified
 
@@ -1873,7 +2751,7 @@ Make sure to extract ALL numbered sections from the document."""
                 return ""
                 
             # Only remove problematic characters that could break analysis
-            text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F-\xFF]', '', text)
+            text = _strip_control_chars(text)
             
             # Keep original line breaks and spacing
             # Only normalize if there are excessive spaces (more than 2)
@@ -1892,7 +2770,7 @@ Make sure to extract ALL numbered sections from the document."""
                 return ""
 
             # Only handle basic cleaning of control characters
-            text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F-\xFF]', '', text)
+            text = _strip_control_chars(text)
             
             # Split into lines while preserving original spacing
             lines = text.splitlines()
@@ -1921,6 +2799,8 @@ Make sure to extract ALL numbered sections from the document."""
     def format_comparison_result(self, result: Dict) -> Dict:
         """Format comparison result for better frontend display"""
         try:
+            component_scores = result.get('component_scores') or {}
+            differences = result.get('differences') or {}
             formatted_result = {
                 'summary': {
                     'overall_similarity': min(max(result.get('similarity_score', 0), 0), 100),
@@ -1931,47 +2811,47 @@ Make sure to extract ALL numbered sections from the document."""
                 
                 'detailed_scores': {
                     'legal_terms': {
-                        'score': result.get('component_scores', {}).get('legal_term_score', 0),
+                        'score': component_scores.get('legal_term_score', 0),
                         'weight': '40%',
                         'description': 'Analysis of legal terminology and context'
                     },
                     'numeric_values': {
-                        'score': result.get('component_scores', {}).get('numeric_score', 0),
+                        'score': component_scores.get('numeric_score', 0),
                         'weight': '25%',
                         'description': 'Comparison of dates, amounts, and durations'
                     },
                     'obligations': {
-                        'score': result.get('component_scores', {}).get('obligation_score', 0),
+                        'score': component_scores.get('obligation_score', 0),
                         'weight': '20%',
                         'description': 'Analysis of legal obligations and requirements'
                     },
                     'semantic': {
-                        'score': result.get('component_scores', {}).get('semantic_score', 0),
+                        'score': component_scores.get('semantic_score', 0),
                         'weight': '15%',
                         'description': 'General meaning and context comparison'
                     }
                 },
 
                 'changes': {
-                    'critical_changes': self._format_critical_changes(result.get('differences', {}).get('legal_terms', {})),
-                    'numeric_changes': self._format_numeric_changes(result.get('differences', {}).get('numeric_values', [])),
-                    'obligation_changes': self._format_obligation_changes(result.get('differences', {}).get('obligations', [])),
+                    'critical_changes': self._format_critical_changes(differences.get('legal_terms', {})),
+                    'numeric_changes': self._format_numeric_changes(differences.get('numeric_values', [])),
+                    'obligation_changes': self._format_obligation_changes(differences.get('obligations', [])),
                 },
 
                 'risk_analysis': {
                     'level': result.get('risk_level', 'Unknown'),
-                    'factors': self._get_risk_factors(result.get('differences', {})),
-                    'recommendations': self._get_recommendations(result.get('differences', {}))
+                    'factors': self._get_risk_factors(differences),
+                    'recommendations': self._get_recommendations(differences)
                 },
 
                 'visual_data': {
                     'similarity_chart': {
                         'labels': ['Legal Terms', 'Numeric Values', 'Obligations', 'Semantic'],
                         'values': [
-                            result.get('component_scores', {}).get('legal_term_score', 0),
-                            result.get('component_scores', {}).get('numeric_score', 0),
-                            result.get('component_scores', {}).get('obligation_score', 0),
-                            result.get('component_scores', {}).get('semantic_score', 0)
+                            component_scores.get('legal_term_score', 0),
+                            component_scores.get('numeric_score', 0),
+                            component_scores.get('obligation_score', 0),
+                            component_scores.get('semantic_score', 0)
                         ]
                     }
                 }
@@ -1993,16 +2873,7 @@ Make sure to extract ALL numbered sections from the document."""
 
     def _get_comparison_status(self, similarity_score: float) -> str:
         """Get a user-friendly status based on similarity score"""
-        if similarity_score >= 95:
-            return 'Nearly Identical'
-        elif similarity_score >= 85:
-            return 'Very Similar'
-        elif similarity_score >= 70:
-            return 'Similar with Notable Changes'
-        elif similarity_score >= 50:
-            return 'Significantly Different'
-        else:
-            return 'Substantially Different'
+        return _STATUS_LABELS[bisect.bisect_right(_STATUS_THRESHOLDS, similarity_score)]
 
     def _format_critical_changes(self, legal_terms: Dict) -> List[Dict]:
         """Format critical legal term changes for frontend display"""
@@ -2015,7 +2886,7 @@ Make sure to extract ALL numbered sections from the document."""
                 'term': change['term'],
                 'original': change['original_context'],
                 'new': change['new_context'],
-                'importance': 'High' if change['term'] in ['shall', 'must', 'will'] else 'Medium'
+                'importance': 'High' if change['term'] in _HIGH_IMPORTANCE_TERMS else 'Medium'
             })
         
         # Handle removed terms
@@ -2036,7 +2907,7 @@ Make sure to extract ALL numbered sections from the document."""
             'original': change.get('from', 'N/A'),
             'new': change.get('to', 'N/A'),
             'difference': self._calculate_difference(change.get('from', '0'), change.get('to', '0')),
-            'importance': 'High' if change['type'] in ['money', 'percentage'] else 'Medium'
+            'importance': 'High' if change['type'] in _FINANCIAL_VALUE_TYPES else 'Medium'
         } for change in numeric_values]
     
 
@@ -2063,7 +2934,7 @@ Make sure to extract ALL numbered sections from the document."""
         
         # Check numeric changes
         numeric_changes = differences.get('numeric_values', [])
-        if any(c['type'] in ['money', 'percentage'] for c in numeric_changes):
+        if any(c['type'] in _FINANCIAL_VALUE_TYPES for c in numeric_changes):
             risk_factors.append({
                 'factor': 'Financial Changes',
                 'importance': 'High',
@@ -2099,16 +2970,9 @@ Make sure to extract ALL numbered sections from the document."""
     def _calculate_difference(self, original: str, new: str) -> str:
         """Calculate and format the difference between numeric values"""
         try:
-            # Extract numeric values
-            orig_num = float(''.join(filter(str.isdigit, original.replace(',', ''))))
-            new_num = float(''.join(filter(str.isdigit, new.replace(',', ''))))
-            
-            # Calculate percentage difference
-            if orig_num != 0:
-                diff_percent = ((new_num - orig_num) / orig_num) * 100
-                return f"{diff_percent:+.1f}%"
-            return "N/A"
-        except:
+            # Digit extraction runs in a compiled regex; repeated pairs are cached
+            return _percent_difference(original, new)
+        except Exception:
             return "N/A"
 
     def generate_recommendations(self, comparison_results: Dict) -> List[Dict]:
@@ -2116,85 +2980,50 @@ Make sure to extract ALL numbered sections from the document."""
         try:
             recommendations = []
             
+            # Look up each difference group once
+            diffs = comparison_results.get('differences') or {}
+
             # 1. Process Critical Legal Term Changes
-            legal_changes = comparison_results.get('differences', {}).get('legal_terms', {})
-            if legal_changes.get('modified') or legal_changes.get('removed'):
-                recommendations.append({
-                    'priority': 'High',
-                    'category': 'Legal',
-                    'title': 'Legal Term Modifications',
-                    'description': self._format_legal_changes_description(legal_changes),
-                    'action': 'Review with legal counsel',
-                    'impact': 'May affect legal obligations and rights',
-                    'details': legal_changes
-                })
+            legal_changes = diffs.get('legal_terms') or {}
 
-            # 2. Process Financial Changes
-            numeric_changes = comparison_results.get('differences', {}).get('numeric_values', [])
-            financial_changes = [c for c in numeric_changes if c['type'] in ['money', 'percentage']]
-            if financial_changes:
-                recommendations.append({
-                    'priority': 'High',
-                    'category': 'Financial',
-                    'title': 'Financial Term Changes',
-                    'description': self._format_financial_changes_description(financial_changes),
-                    'action': 'Verify all financial changes and their implications',
-                    'impact': 'Direct monetary impact',
-                    'details': financial_changes
-                })
-
-            # 3. Process Timeline Changes
-            timeline_changes = [c for c in numeric_changes if c['type'] in ['date', 'duration']]
-            if timeline_changes:
-                recommendations.append({
-                    'priority': 'Medium',
-                    'category': 'Timeline',
-                    'title': 'Timeline Modifications',
-                    'description': self._format_timeline_changes_description(timeline_changes),
-                    'action': 'Review all timeline changes and their feasibility',
-                    'impact': 'May affect project schedules and deadlines',
-                    'details': timeline_changes
-                })
+            # 2./3. Split numeric changes into financial and timeline changes
+            numeric_changes = diffs.get('numeric_values') or []
+            financial_changes = [c for c in numeric_changes if c['type'] in _FINANCIAL_VALUE_TYPES]
+            timeline_changes = [c for c in numeric_changes if c['type'] in _TIMELINE_VALUE_TYPES]
 
             # 4. Process Obligation Changes
-            obligation_changes = comparison_results.get('differences', {}).get('obligations', [])
-            if obligation_changes:
-                recommendations.append({
-                    'priority': 'High',
-                    'category': 'Obligations',
-                    'title': 'Changed Obligations',
-                    'description': self._format_obligation_changes_description(obligation_changes),
-                    'action': 'Review all modified obligations and responsibilities',
-                    'impact': 'May affect party responsibilities and requirements',
-                    'details': obligation_changes
-                })
+            obligation_changes = diffs.get('obligations') or []
+
+            # (template, triggered, details, description formatter)
+            sections = (
+                ('legal', legal_changes.get('modified') or legal_changes.get('removed'),
+                 legal_changes, self._format_legal_changes_description),
+                ('financial', financial_changes, financial_changes,
+                 self._format_financial_changes_description),
+                ('timeline', timeline_changes, timeline_changes,
+                 self._format_timeline_changes_description),
+                ('obligations', obligation_changes, obligation_changes,
+                 self._format_obligation_changes_description),
+            )
+            for kind, triggered, details, describe in sections:
+                if triggered:
+                    recommendations.append(_build_recommendation(kind, describe(details), details))
 
             # 5. Risk Level Based Recommendations
             risk_level = comparison_results.get('risk_level', 'Unknown')
             if risk_level == 'High':
-                recommendations.append({
-                    'priority': 'High',
-                    'category': 'Risk',
-                    'title': 'High Risk Changes Detected',
-                    'description': 'Multiple significant changes requiring careful review',
-                    'action': 'Conduct thorough legal and financial review',
-                    'impact': 'Multiple changes may have cumulative risk impact',
-                    'details': {'risk_level': risk_level}
-                })
+                recommendations.append(_build_recommendation(
+                    'risk',
+                    'Multiple significant changes requiring careful review',
+                    {'risk_level': risk_level}
+                ))
 
-            # Sort recommendations by priority
-            priority_order = {'High': 0, 'Medium': 1, 'Low': 2}
-            recommendations.sort(key=lambda x: priority_order[x['priority']])
-
-            return recommendations or [{
-                'priority': 'Low',
-                'category': 'General',
-                'title': 'Minor Changes',
-                'description': 'No significant changes detected',
-                'action': 'Standard review recommended',
-                'impact': 'Minimal impact expected',
-                'details': {}
-            }]
+            # Sort recommendations by priority (stable, so section order is kept)
+            recommendations.sort(key=lambda x: _PRIORITY_ORDER[x['priority']])
+
+            return recommendations or [_build_recommendation(
+                'general', 'No significant changes detected', {}
+            )]
 
         except Exception as e:
             logging.error(f"Error generating recommendations: {str(e)}")
@@ -2219,11 +3048,12 @@ Make sure to extract ALL numbered sections from the document."""
 
     def _format_financial_changes_description(self, changes: List[Dict]) -> str:
         """Format description of financial changes"""
-        total_change = sum(
-            float(c.get('difference', '0').rstrip('%'))
-            for c in changes
-            if c.get('difference', 'N/A') != 'N/A'
-        )
+        total_change = float(np.fromiter(
+            (float(difference.rstrip('%'))
+             for difference in (c.get('difference', '0') for c in changes)
+             if difference != 'N/A'),
+            dtype=np.float64
+        ).sum())
         return (f"{len(changes)} financial term{'s' if len(changes) > 1 else ''} "
                 f"changed with net {total_change:+.1f}% impact.")
 
@@ -2254,6 +3084,10 @@ Make sure to extract ALL numbered sections from the document."""
             # Track processed clauses
             processed_expected = {m['expected_clause']['number'] for m in matches}
             processed_expected.update({p['expected_clause']['number'] for p in partial_matches})
+
+            # First match / partial match recorded for each expected clause number
+            matches_by_number = _index_by_expected_number(matches)
+            partials_by_number = _index_by_expected_number(partial_matches)
             
             # Check each expected clause
             for exp_clause in expected_clauses:
@@ -2261,34 +3095,27 @@ Make sure to extract ALL numbered sections from the document."""
                 if not is_critical:
                     continue
                     
-                # Check if this clause is in matches
-                matched = False
-                for match in matches:
-                    if match['expected_clause']['number'] == exp_clause['number']:
-                        results['matched_critical'].append({
-                            'type': clause_type,
-                            'expected': exp_clause['text'],
-                            'actual': match['contract_clause']['text'],
-                            'similarity': match['similarity_score']
-                        })
-                        matched = True
-                        break
-                        
-                # If not in matches, check partial matches
-                if not matched:
-                    for partial in partial_matches:
-                        if partial['expected_clause']['number'] == exp_clause['number']:
-                            results['modified_critical'].append({
-                                'type': clause_type,
-                                'expected': exp_clause['text'],
-                                'actual': partial['contract_clause']['text'],
-                                'similarity': partial['similarity_score']
-                            })
-                            matched = True
-                            break
-                            
-                # If not found at all, it's missing
-                if not matched:
+                # Check if this clause is in matches, then partial matches
+                match = matches_by_number.get(exp_clause['number'])
+                if match is not None:
+                    results['matched_critical'].append({
+                        'type': clause_type,
+                        'expected': exp_clause['text'],
+                        'actual': match['contract_clause']['text'],
+                        'similarity': match['similarity_score']
+                    })
+                    continue
+
+                partial = partials_by_number.get(exp_clause['number'])
+                if partial is not None:
+                    results['modified_critical'].append({
+                        'type': clause_type,
+                        'expected': exp_clause['text'],
+                        'actual': partial['contract_clause']['text'],
+                        'similarity': partial['similarity_score']
+                    })
+                else:
+                    # If not found at all, it's missing
                     results['missing_critical'].append({
                         'type': clause_type,
                         'expected': exp_clause['text']
@@ -2315,32 +3142,33 @@ Make sure to extract ALL numbered sections from the document."""
             # Input validation
             if not text or not isinstance(text, str):
                 raise ValueError("Input text must be a non-empty string")
+
+            cached = self._critical_cache.get(text)
+            if cached is not None:
+                return cached
             
-            text_lower = text.lower()
-            matched_types = []
+            matched_types = set()
             highest_importance = ''
-            
-            # Map importance levels to numeric values for comparison
-            importance_levels = {'High': 3, 'Medium': 2, 'Low': 1}
-            
-            for clause_type, info in self.critical_clause_patterns.items():
-                for pattern in info['patterns']:
-                    try:
-                        if re.search(pattern, text_lower):
-                            matched_types.append(clause_type)
-                            # Update highest importance if current is higher
-                            current_importance = info.get('importance', 'Low')
-                            if not highest_importance or importance_levels.get(current_importance, 0) > importance_levels.get(highest_importance, 0):
-                                highest_importance = current_importance
-                            break  # Found match for this clause type, move to next
-                    except re.error as e:
-                        logger.error(f"Invalid regex pattern in critical_clause_patterns: {pattern}")
-                        continue
+            highest_level = 0
+            
+            for clause_type, pattern, importance in self._critical_patterns_compiled:
+                if clause_type in matched_types:
+                    continue  # Already matched this clause type
+                if pattern.search(text):
+                    matched_types.add(clause_type)
+                    # Update highest importance if current is higher
+                    level = self._importance_levels.get(importance, 0)
+                    if not highest_importance or level > highest_level:
+                        highest_importance = importance
+                        highest_level = level
             
             if matched_types:
-                return True, '|'.join(set(matched_types)), highest_importance
-                
-            return False, '', ''
+                classification = (True, '|'.join(matched_types), highest_importance)
+            else:
+                classification = (False, '', '')
+            
+            self._remember_extraction(self._critical_cache, text, classification)
+            return classification
             
         except Exception as e:
             logger.error(f"Error in is_critical_clause: {str(e)}")
@@ -2386,75 +3214,43 @@ Make sure to extract ALL numbered sections from the document."""
             print(f"Expected Clauses: {len(expected_clauses)}")
             print(f"Contract Clauses: {len(contract_clauses)}")
 
+            # Encode both sides in one deduplicated batch
+            embeddings = self._encode_batch(
+                [c['text'] for c in expected_clauses] + [c['text'] for c in contract_clauses]
+            )
+            expected_embeddings = embeddings[:len(expected_clauses)]
+            contract_embeddings = embeddings[len(expected_clauses):]
+
             print("\n=== Processing Each Expected Clause ===")
-            for expected_clause in expected_clauses:
-                print(f"\nAnalyzing Expected Clause {expected_clause.get('number', 'Unknown')}:")
-                print(f"Title: {expected_clause.get('title', 'Untitled')}")
-                
-                best_match = None
-                best_score = 0
-                best_result = None
-
-                print("\nLooking for matches in contract clauses...")
-                for contract_clause in contract_clauses:
-                    # Compare texts using detailed analysis
-                    result = self.compare_texts(
-                        expected_clause['text'],
-                        contract_clause['text']
-                    )
-                    
-                    # Ensure result has all required fields
-                    if not isinstance(result, dict):
-                        result = {
-                            'similarity_score': 0.0,
-                            'component_scores': {
-                                'legal_term_score': 0.0,
-                                'numeric_score': 0.0,
-                                'obligation_score': 0.0,
-                                'semantic_score': 0.0
-                            },
-                            'differences': {}
-                        }
-                    
-                    print(f"\nComparing with Contract Clause {contract_clause.get('number', 'Unknown')}:")
-                    print(f"Similarity Score: {result.get('similarity_score', 0):.2f}%")
-                    print(f"Component Scores:")
-                    print(f"- Legal Terms: {result.get('component_scores', {}).get('legal_term_score', 0):.2f}%")
-                    print(f"- Numeric Values: {result.get('component_scores', {}).get('numeric_score', 0):.2f}%")
-                    print(f"- Obligations: {result.get('component_scores', {}).get('obligation_score', 0):.2f}%")
-                    print(f"- Semantic: {result.get('component_scores', {}).get('semantic_score', 0):.2f}%")
-                    
-                    if result.get('similarity_score', 0) > best_score:
-                        best_score = result.get('similarity_score', 0)
-                        best_match = contract_clause
-                        best_result = result.copy()  # Make a copy to prevent reference issues
-                        # Update component scores with the best match's scores
-                        comparison_results['component_scores'] = result.get('component_scores', {}).copy()
-                        print(f"New best match found! Score: {best_score:.2f}%")
-
-                # Categorize the match
-                if best_match and best_result:
-                    print(f"\nBest Match Results:")
-                    print(f"Final Score: {best_score:.2f}%")
-                    print(f"Match Category: ", end="")
-                    
-                    match_data = {
-                        'expected_clause': expected_clause,
-                        'contract_clause': best_match,
-                        'similarity_score': best_score,
-                        'differences': best_result.get('differences', {}),
-                        'component_scores': best_result.get('component_scores', {}).copy()
-                    }
-                    
-                    if best_score >= 90:
-                        print("EXACT MATCH")
-                        comparison_results['matches'].append(match_data)
-                    elif best_score >= 70:
-                        print("PARTIAL MATCH")
-                        comparison_results['partial_matches'].append(match_data)
-                    else:
-                        print("MISMATCH")
-                        comparison_results['mismatches'].append(match_data)
+            best_indices, best_scores, best_results = self._score_clause_blocks(
+                expected_clauses, contract_clauses, expected_embeddings, contract_embeddings
+            )
+            # Bucket all best scores at once (mismatch / partial / exact)
+            categories = np.searchsorted(_MATCH_THRESHOLDS, best_scores, side='right')
+
+            # Expected clauses with no contract clause scoring above zero are skipped
+            for i in np.flatnonzero(best_scores > 0):
+                expected_clause = expected_clauses[i]
+                best_score = float(best_scores[i])
+                best_match = contract_clauses[best_indices[i]]
+                best_result = best_results[i]
+                best_component_scores = best_result.get('component_scores') or {}
+                # Component scores reflect the last expected clause with a match
+                comparison_results['component_scores'] = best_component_scores.copy()
+
+                match_data = {
+                    'expected_clause': expected_clause,
+                    'contract_clause': best_match,
+                    'similarity_score': best_score,
+                    'differences': best_result.get('differences') or {},
+                    'component_scores': best_component_scores.copy()
+                }
+                category = _MATCH_CATEGORIES[categories[i]]
+                comparison_results[category].append(match_data)
+
+                if self.debug:
+                    logger.debug("Best match for expected clause %s: %.2f%% (%s)",
+                                 expected_clause.get('number', 'Unknown'), best_score, category)
 
             print("\n=== Calculating Final Scores ===")
             # Calculate overall metrics
@@ -2496,6 +3292,101 @@ Make sure to extract ALL numbered sections from the document."""
             print(f"Traceback: {traceback.format_exc()}")
             return comparison_results
 
+        finally:
+            self._flush_score_cache()
+
+    def _score_clause_blocks(
+            self,
+            expected_clauses: List[Dict],
+            contract_clauses: List[Dict],
+            expected_embeddings: np.ndarray,
+            contract_embeddings: np.ndarray
+        ) -> Tuple[np.ndarray, np.ndarray, List[Optional[Dict]]]:
+        """Best contract clause index, score and result for each expected clause.
+
+        Expected clauses are scored in blocks of _SIMILARITY_BLOCK rows, and
+        each block is reduced to its best matches before the next one starts,
+        so neither the full semantic matrix nor every pair result is held.
+        """
+        total = len(expected_clauses)
+        best_indices = np.zeros(total, dtype=np.intp)
+        best_scores = np.zeros(total)
+        best_results: List[Optional[Dict]] = [None] * total
+
+        for start in range(0, total, _SIMILARITY_BLOCK):
+            stop = min(start + _SIMILARITY_BLOCK, total)
+            semantic_block = expected_embeddings[start:stop] @ contract_embeddings.T
+            semantic_block *= 100
+
+            # Expected clauses are scored independently, one row per task
+            rows = list(self._clause_executor.map(
+                self._score_expected_clause,
+                expected_clauses[start:stop],
+                [contract_clauses] * (stop - start),
+                semantic_block
+            ))
+            block_scores = np.array(
+                [[result.get('similarity_score', 0) for result in row] for row in rows],
+                dtype=np.float64
+            ).reshape(stop - start, len(contract_clauses))
+
+            block_indices, block_best = _select_best_matches(block_scores)
+            best_indices[start:stop] = block_indices
+            best_scores[start:stop] = block_best
+            best_results[start:stop] = [
+                row[j] if row else None for row, j in zip(rows, block_indices)
+            ]
+
+        return best_indices, best_scores, best_results
+
+    def _score_expected_clause(self, expected_clause: Dict, contract_clauses: List[Dict],
+                               semantic_row: np.ndarray) -> List[Dict]:
+        """Compare one expected clause with every contract clause, given the
+        row of precomputed semantic scores for those pairs"""
+        if self.debug:
+            logger.debug("Analyzing expected clause %s: %s",
+                         expected_clause.get('number', 'Unknown'),
+                         expected_clause.get('title', 'Untitled'))
+
+        row_results = []
+        for contract_clause, semantic_score in zip(contract_clauses, semantic_row.tolist()):
+            # Compare texts using detailed analysis
+            result = self.compare_texts(
+                expected_clause['text'],
+                contract_clause['text'],
+                semantic_score=semantic_score
+            )
+
+            # Ensure result has all required fields
+            if not isinstance(result, dict):
+                result = {
+                    'similarity_score': 0.0,
+                    'component_scores': {
+                        'legal_term_score': 0.0,
+                        'numeric_score': 0.0,
+                        'obligation_score': 0.0,
+                        'semantic_score': 0.0
+                    },
+                    'differences': {}
+                }
+
+            if self.debug:
+                component_scores = result.get('component_scores') or {}
+                logger.debug(
+                    "Contract clause %s: similarity=%.2f%% legal=%.2f%% numeric=%.2f%% "
+                    "obligations=%.2f%% semantic=%.2f%%",
+                    contract_clause.get('number', 'Unknown'),
+                    result.get('similarity_score', 0),
+                    component_scores.get('legal_term_score', 0),
+                    component_scores.get('numeric_score', 0),
+                    component_scores.get('obligation_score', 0),
+                    component_scores.get('semantic_score', 0)
+                )
+
+            row_results.append(result)
+
+        return row_results
+
     def _analyze_clause_differences(self, exp_clause: Dict, cont_clause: Dict) -> Dict:
         """Analyze specific differences between two clauses."""
         analysis = {
@@ -2507,9 +3398,17 @@ Make sure to extract ALL numbered sections from the document."""
         }
 
         try:
-            # Compare structure
-            exp_sentences = sent_tokenize(exp_clause['text'])
-            cont_sentences = sent_tokenize(cont_clause['text'])
+            # Boilerplate clauses recur across contracts; reuse earlier analyses
+            cache_key = self._clause_difference_key(exp_clause, cont_clause)
+            with self._diff_cache_lock:
+                cached = self._diff_cache.get(cache_key)
+                if cached is not None:
+                    self._diff_cache.move_to_end(cache_key)
+                    return copy.deepcopy(cached)
+
+            # Compare structure (each clause text is tokenized only once)
+            exp_sentences = _tokenize_sentences(exp_clause['text'])
+            cont_sentences = _tokenize_sentences(cont_clause['text'])
             
             # Analyze sentence-level changes
             analysis['structural_changes'] = self._compare_sentence_structures(exp_sentences, cont_sentences)
@@ -2528,12 +3427,27 @@ Make sure to extract ALL numbered sections from the document."""
             # Determine significance of changes
             analysis['significance'] = self._determine_change_significance(analysis)
 
+            with self._diff_cache_lock:
+                self._diff_cache[cache_key] = copy.deepcopy(analysis)
+                if len(self._diff_cache) > self._diff_cache_size:
+                    self._diff_cache.popitem(last=False)
+
             return analysis
         except Exception as e:
             logger.error(f"Error in _analyze_clause_differences: {str(e)}")
             return analysis
 
-    def _compare_sentence_structures(self, exp_sentences: List[str], cont_sentences: List[str]) -> List[Dict]:
+    def _clause_difference_key(self, exp_clause: Dict, cont_clause: Dict) -> Tuple:
+        """Key of _analyze_clause_differences: exact text digests plus entity sets"""
+        def text_digest(clause: Dict) -> bytes:
+            return hashlib.blake2b(clause['text'].encode('utf-8'), digest_size=16).digest()
+
+        def entity_set(clause: Dict) -> frozenset:
+            return frozenset((e.get('text', ''), e.get('label', '')) for e in clause.get('entities', []))
+
+        return (text_digest(exp_clause), text_digest(cont_clause), entity_set(exp_clause), entity_set(cont_clause))
+
+    def _compare_sentence_structures(self, exp_sentences: Sequence[str], cont_sentences: Sequence[str]) -> List[Dict]:
         """Compare sentence structures between clauses."""
         changes = []
         try:
@@ -2545,27 +3459,30 @@ Make sure to extract ALL numbered sections from the document."""
                     'severity': 'Medium'
                 })
 
+            # Tag every aligned sentence of both clauses in one batch
+            aligned = min(len(exp_sentences), len(cont_sentences))
+            patterns = self._get_sentence_patterns(
+                list(exp_sentences[:aligned]) + list(cont_sentences[:aligned])
+            )
+
             # Compare each sentence
-            for i, exp_sent in enumerate(exp_sentences):
-                if i < len(cont_sentences):
-                    # Compare sentence lengths
-                    len_diff = abs(len(exp_sent.split()) - len(cont_sentences[i].split()))
-                    if len_diff > 5:
-                        changes.append({
-                            'type': 'structure',
-                            'description': f'Significant length difference in sentence {i+1}',
-                            'severity': 'Low'
-                        })
+            for i, exp_sent in enumerate(exp_sentences[:aligned]):
+                # Compare sentence lengths
+                len_diff = abs(len(exp_sent.split()) - len(cont_sentences[i].split()))
+                if len_diff > 5:
+                    changes.append({
+                        'type': 'structure',
+                        'description': f'Significant length difference in sentence {i+1}',
+                        'severity': 'Low'
+                    })
 
-                    # Compare sentence patterns
-                    exp_pattern = self._get_sentence_pattern(exp_sent)
-                    cont_pattern = self._get_sentence_pattern(cont_sentences[i])
-                    if exp_pattern != cont_pattern:
-                        changes.append({
-                            'type': 'structure',
-                            'description': f'Different sentence structure in sentence {i+1}',
-                            'severity': 'Medium'
-                        })
+                # Compare sentence patterns
+                if patterns[i] != patterns[aligned + i]:
+                    changes.append({
+                        'type': 'structure',
+                        'description': f'Different sentence structure in sentence {i+1}',
+                        'severity': 'Medium'
+                    })
 
         except Exception as e:
             logger.error(f"Error in _compare_sentence_structures: {str(e)}")
@@ -2576,21 +3493,22 @@ Make sure to extract ALL numbered sections from the document."""
         """Compare numeric values between texts."""
         changes = []
         try:
-            # Extract numeric values with context
-            patterns = {
-                'amount': r'(?:USD|€|£|\$)\s*\d+(?:,\d{3})*(?:\.\d{2})?',
-                'percentage': r'\d+(?:\.\d+)?%',
-                'duration': r'\d+\s*(?:day|week|month|year)s?',
-                'date': r'\d{1,2}[-/]\d{1,2}[-/]\d{2,4}'
-            }
-
             # Convert inputs to strings if they're not already
             text1_str = text1 if isinstance(text1, str) else str(text1)
             text2_str = text2 if isinstance(text2, str) else str(text2)
 
-            for value_type, pattern in patterns.items():
-                values1 = re.findall(pattern, text1_str)
-                values2 = re.findall(pattern, text2_str)
+            # One scan per text; dicts act as insertion-ordered sets per type
+            value_types = ('amount', 'percentage', 'duration', 'date')
+            values1_by_type = {value_type: {} for value_type in value_types}
+            values2_by_type = {value_type: {} for value_type in value_types}
+            for match in _CLAUSE_NUMERIC_RE.finditer(text1_str):
+                values1_by_type[match.lastgroup][match.group()] = None
+            for match in _CLAUSE_NUMERIC_RE.finditer(text2_str):
+                values2_by_type[match.lastgroup][match.group()] = None
+
+            for value_type in value_types:
+                values1 = values1_by_type[value_type]
+                values2 = values2_by_type[value_type]
 
                 # Compare values
                 for val1 in values1:
@@ -2600,7 +3518,7 @@ Make sure to extract ALL numbered sections from the document."""
                             'value_type': value_type,
                             'expected': val1,
                             'found': 'missing',
-                            'severity': 'High' if value_type in ['amount', 'percentage'] else 'Medium'
+                            'severity': 'High' if value_type in _HIGH_SEVERITY_VALUE_TYPES else 'Medium'
                         })
 
                 for val2 in values2:
@@ -2610,7 +3528,7 @@ Make sure to extract ALL numbered sections from the document."""
                             'value_type': value_type,
                             'expected': 'not present',
                             'found': val2,
-                            'severity': 'High' if value_type in ['amount', 'percentage'] else 'Medium'
+                            'severity': 'High' if value_type in _HIGH_SEVERITY_VALUE_TYPES else 'Medium'
                         })
 
             return changes
@@ -2627,14 +3545,11 @@ Make sure to extract ALL numbered sections from the document."""
             if not obligations1 and not obligations2:
                 return 100.0
                 
-            matches = 0
+            # Multiset intersection: a repeated obligation only matches as
+            # many times as it occurs on the other side
+            shared = Counter(o['text'] for o in obligations1) & Counter(o['text'] for o in obligations2)
+            matches = sum(shared.values())
             total = max(len(obligations1), len(obligations2))
-            
-            for obl1 in obligations1:
-                for obl2 in obligations2:
-                    if obl1['text'] == obl2['text']:
-                        matches += 1
-                        break
                         
             return (matches / total * 100) if total > 0 else 0.0
             
@@ -2670,11 +3585,8 @@ Make sure to extract ALL numbered sections from the document."""
                     'severity': 'Medium'
                 })
 
-            # Compare obligations
-            obligations1 = self._extract_obligations(text1)
-            obligations2 = self._extract_obligations(text2)
-
-            if obligations1 != obligations2:
+            # Compare obligations by their sorted obligation phrases
+            if self._obligation_signature(text1) != self._obligation_signature(text2):
                 changes.append({
                     'type': 'content',
                     'description': 'Modified obligations',
@@ -2689,26 +3601,20 @@ Make sure to extract ALL numbered sections from the document."""
     def _determine_change_significance(self, analysis: Dict) -> str:
         """Determine the overall significance of changes."""
         try:
-            # Count high severity changes
-            high_severity_count = sum(
-                1 for changes in analysis.values() 
-                if isinstance(changes, list) 
-                and any(change.get('severity') == 'High' for change in changes)
-            )
+            # Single pass: any High change decides immediately, otherwise
+            # remember whether a Medium one was seen
+            saw_medium = False
+            for changes in analysis.values():
+                if not isinstance(changes, list):
+                    continue
+                for change in changes:
+                    severity = change.get('severity')
+                    if severity == 'High':
+                        return 'High'
+                    if severity == 'Medium':
+                        saw_medium = True
 
-            # Count medium severity changes
-            medium_severity_count = sum(
-                1 for changes in analysis.values() 
-                if isinstance(changes, list) 
-                and any(change.get('severity') == 'Medium' for change in changes)
-            )
-
-            # Determine overall significance
-            if high_severity_count > 0:
-                return 'High'
-            elif medium_severity_count > 0:
-                return 'Medium'
-            return 'Low'
+            return 'Medium' if saw_medium else 'Low'
 
         except Exception as e:
             logger.error(f"Error in _determine_change_significance: {str(e)}")
@@ -2747,27 +3653,30 @@ Make sure to extract ALL numbered sections from the document."""
         """Process an exact match between clauses."""
         try:
             # Create match info
+            changes = []
             match_info = {
                 'expected_clause': exp_clause,
                 'contract_clause': cont_clause,
                 'similarity_score': score,
                 'analysis': analysis,
-                'changes': []
+                'changes': changes
             }
 
             # Even in exact matches, check for minor variations
-            if analysis.get('numeric_changes'):
-                match_info['changes'].append({
+            numeric_changes = analysis.get('numeric_changes')
+            if numeric_changes:
+                changes.append({
                     'type': 'numeric',
                     'message': 'Minor numeric value differences detected',
-                    'details': analysis['numeric_changes']
+                    'details': numeric_changes
                 })
 
-            if analysis.get('entity_changes'):
-                match_info['changes'].append({
+            entity_changes = analysis.get('entity_changes')
+            if entity_changes:
+                changes.append({
                     'type': 'entity',
                     'message': 'Entity reference differences detected',
-                    'details': analysis['entity_changes']
+                    'details': entity_changes
                 })
 
             # Add to matches
@@ -2796,34 +3705,38 @@ Make sure to extract ALL numbered sections from the document."""
     def _process_partial_match(self, exp_clause: Dict, cont_clause: Dict, score: float, analysis: Dict, results: Dict) -> None:
         """Process a partial match between clauses."""
         try:
+            changes = []
             match_info = {
                 'expected_clause': exp_clause,
                 'contract_clause': cont_clause,
                 'similarity_score': score,
                 'analysis': analysis,
-                'changes': []
+                'changes': changes
             }
 
             # Analyze differences
-            if analysis['structural_changes']:
-                match_info['changes'].append({
+            structural_changes = analysis['structural_changes']
+            if structural_changes:
+                changes.append({
                     'type': 'structure',
                     'message': 'Structural differences detected',
-                    'details': analysis['structural_changes']
+                    'details': structural_changes
                 })
 
-            if analysis['numeric_changes']:
-                match_info['changes'].append({
+            numeric_changes = analysis['numeric_changes']
+            if numeric_changes:
+                changes.append({
                     'type': 'numeric',
                     'message': 'Numeric value differences detected',
-                    'details': analysis['numeric_changes']
+                    'details': numeric_changes
                 })
 
-            if analysis['content_changes']:
-                match_info['changes'].append({
+            content_changes = analysis['content_changes']
+            if content_changes:
+                changes.append({
                     'type': 'content',
                     'message': 'Content differences detected',
-                    'details': analysis['content_changes']
+                    'details': content_changes
                 })
 
             results['partial_matches'].append(match_info)
@@ -2831,7 +3744,7 @@ Make sure to extract ALL numbered sections from the document."""
                 'title': exp_clause.get('title', ''),
                 'number': exp_clause.get('number', ''),
                 'similarity': score,
-                'changes': match_info['changes']
+                'changes': changes
             })
 
         except Exception as e:
@@ -2840,23 +3753,24 @@ Make sure to extract ALL numbered sections from the document."""
     def _process_mismatch(self, exp_clause: Dict, cont_clause: Dict, score: float, analysis: Dict, results: Dict) -> None:
         """Process a mismatch between clauses."""
         try:
+            is_critical = exp_clause.get('is_critical', False)
             mismatch_info = {
                 'expected_clause': exp_clause,
                 'best_match': cont_clause,
                 'similarity_score': score,
                 'analysis': analysis,
-                'risk_level': 'High' if exp_clause.get('is_critical', False) else 'Medium'
+                'risk_level': 'High' if is_critical else 'Medium'
             }
 
             results['mismatches'].append(mismatch_info)
             results['section_analysis']['missing_sections'].append({
                 'title': exp_clause.get('title', ''),
                 'number': exp_clause.get('number', ''),
-                'is_critical': exp_clause.get('is_critical', False)
+                'is_critical': is_critical
             })
 
             # Update risk analysis
-            if exp_clause.get('is_critical', False):
+            if is_critical:
                 results['risk_analysis']['high_risk_items'].append({
                     'type': 'missing_critical_clause',
                     'clause': exp_clause,
@@ -2869,21 +3783,18 @@ Make sure to extract ALL numbered sections from the document."""
     def _process_extra_clause(self, cont_clause: Dict, results: Dict) -> None:
         """Process an extra clause found in the contract."""
         try:
-            extra_info = {
-                'contract_clause': cont_clause,
-                'risk_level': self._assess_extra_clause_risk(cont_clause)
-            }
+            risk_level = self._assess_extra_clause_risk(cont_clause)
 
             results['mismatches'].append({
                 'type': 'extra_clause',
                 'clause': cont_clause,
-                'risk_level': extra_info['risk_level']
+                'risk_level': risk_level
             })
 
             results['section_analysis']['extra_sections'].append({
                 'title': cont_clause.get('title', ''),
                 'number': cont_clause.get('number', ''),
-                'risk_level': extra_info['risk_level']
+                'risk_level': risk_level
             })
 
         except Exception as e:
@@ -2908,17 +3819,13 @@ Make sure to extract ALL numbered sections from the document."""
             for match in results.get('partial_matches', []):
                 analysis = match.get('analysis', {})
                 
-                # Check numeric changes
-                numeric_changes = [c for c in analysis.get('numeric_changes', []) if c.get('severity') == 'High']
-                risk_scores['numeric_changes'] += len(numeric_changes) * 15
-
-                # Check structural changes
-                structural_changes = [c for c in analysis.get('structural_changes', []) if c.get('severity') == 'High']
-                risk_scores['structural_changes'] += len(structural_changes) * 10
-
-                # Check content changes
-                content_changes = [c for c in analysis.get('content_changes', []) if c.get('severity') == 'High']
-                risk_scores['content_changes'] += len(content_changes) * 15
+                # Count High severity numeric, structural and content changes
+                # without building filtered lists
+                for change_key, weight in _PARTIAL_CHANGE_RISK_WEIGHTS:
+                    high_count = sum(
+                        1 for c in analysis.get(change_key, ()) if c.get('severity') == 'High'
+                    )
+                    risk_scores[change_key] += high_count * weight
 
             # Calculate total risk score (normalized to 0-100)
             total_risk_score = sum(risk_scores.values())
@@ -2991,8 +3898,11 @@ Make sure to extract ALL numbered sections from the document."""
             modified_sections = results.get('partial_matches', [])
             structure_issues = [
                 section for section in modified_sections
-                if any(change.get('type') == 'structure' for change in section.get('differences', {}).get('structural_changes', []))
-            ]
+                if any(
+                    change.get('type') == 'structure'
+                    for change in (section.get('differences') or {}).get('structural_changes', ())
+                )
+            ] if modified_sections else []
             if structure_issues:
                 recommendations.append({
                     'priority': 'Medium',
@@ -3010,29 +3920,30 @@ Make sure to extract ALL numbered sections from the document."""
     def _calculate_overall_metrics(self, results: Dict) -> None:
         """Calculate overall metrics for the comparison."""
         try:
+            summary = results['summary']
+
             # Calculate match counts
-            results['summary']['match_count'] = len(results.get('matches', []))
-            results['summary']['partial_match_count'] = len(results.get('partial_matches', []))
-            results['summary']['mismatch_count'] = len(results.get('mismatches', []))
+            match_count = summary['match_count'] = len(results.get('matches', []))
+            partial_count = summary['partial_match_count'] = len(results.get('partial_matches', []))
+            mismatch_count = summary['mismatch_count'] = len(results.get('mismatches', []))
             
             # Calculate total clauses
-            total_clauses = (results['summary']['match_count'] + 
-                           results['summary']['partial_match_count'] + 
-                           results['summary']['mismatch_count'])
+            total_clauses = match_count + partial_count + mismatch_count
 
             # Calculate similarity score if there are clauses
             if total_clauses > 0:
-                weighted_matches = results['summary']['match_count'] * 1.0
-                weighted_partials = results['summary']['partial_match_count'] * 0.5
+                weighted_matches = match_count * 1.0
+                weighted_partials = partial_count * 0.5
                 similarity_score = (weighted_matches + weighted_partials) / total_clauses * 100  # Convert to percentage
-                results['summary']['overall_similarity'] = round(similarity_score, 1)
+                summary['overall_similarity'] = round(similarity_score, 1)
             else:
-                results['summary']['overall_similarity'] = 0.0
+                summary['overall_similarity'] = 0.0
 
             # Count critical issues
-            missing_critical = len(results['critical_analysis'].get('missing_critical', []))
-            modified_critical = len(results['critical_analysis'].get('modified_critical', []))
-            results['summary']['critical_issues_count'] = missing_critical + modified_critical
+            critical_analysis = results['critical_analysis']
+            missing_critical = len(critical_analysis.get('missing_critical', []))
+            modified_critical = len(critical_analysis.get('modified_critical', []))
+            summary['critical_issues_count'] = missing_critical + modified_critical
 
         except Exception as e:
             logger.error(f"Error in _calculate_overall_metrics: {str(e)}")
@@ -3048,21 +3959,16 @@ Make sure to extract ALL numbered sections from the document."""
     def _assess_extra_clause_risk(self, clause: Dict) -> str:
         """Assess the risk level of an extra clause."""
         try:
-            # Check for critical keywords
-            critical_keywords = [
-                'terminate', 'liability', 'indemnify', 'warrant',
-                'confidential', 'payment', 'intellectual property'
-            ]
-            
             text = clause.get('text', '').lower()
-            
-            if any(keyword in text for keyword in critical_keywords):
+
+            # Check for critical keywords
+            if _EXTRA_CLAUSE_KEYWORD_RE.search(text):
                 return 'High'
-            
+
             # Check for monetary values
-            if re.search(r'(?:USD|€|£|\$)\s*\d+', text):
+            if _has_money_amount(text):
                 return 'Medium'
-            
+
             return 'Low'
 
         except Exception as e:
@@ -3072,44 +3978,41 @@ Make sure to extract ALL numbered sections from the document."""
     def _analyze_critical_clauses(self, expected_clauses: List[Dict], contract_clauses: List[Dict], results: Dict) -> None:
         """Analyze critical clauses and update results."""
         try:
+            critical_analysis = results['critical_analysis']
+            matches_by_number = _index_by_expected_number(results['matches'])
+            partials_by_number = _index_by_expected_number(results['partial_matches'])
+
             # Check each expected clause
             for exp_clause in expected_clauses:
                 is_critical, clause_type, importance = self.is_critical_clause(exp_clause['text'])
                 if not is_critical:
                     continue
 
-                # Look for matches in results
-                found_match = False
-                for match in results['matches']:
-                    if match['expected_clause']['number'] == exp_clause['number']:
-                        results['critical_analysis']['matched_critical'].append({
-                            'type': clause_type,
-                            'expected': exp_clause['text'],
-                            'actual': match['contract_clause']['text'],
-                            'similarity': match['similarity_score']
-                        })  # Fixed missing closing brace
-                        found_match = True
-                        break
+                # Look for matches in results, then partial matches
+                match = matches_by_number.get(exp_clause['number'])
+                if match is not None:
+                    critical_analysis['matched_critical'].append({
+                        'type': clause_type,
+                        'expected': exp_clause['text'],
+                        'actual': match['contract_clause']['text'],
+                        'similarity': match['similarity_score']
+                    })
+                    continue
 
-                if not found_match:
-                    # Check partial matches
-                    for partial in results['partial_matches']:
-                        if partial['expected_clause']['number'] == exp_clause['number']:
-                            results['critical_analysis']['modified_critical'].append({
-                                'type': clause_type,
-                                'expected': exp_clause['text'],
-                                'actual': partial['contract_clause']['text'],
-                                'similarity': partial['similarity_score']
-                            })
-                            found_match = True
-                            break
-
-                    if not found_match:
-                        # Not found at all - missing critical clause
-                        results['critical_analysis']['missing_critical'].append({
-                            'type': clause_type,
-                            'expected': exp_clause['text']
-                        })
+                partial = partials_by_number.get(exp_clause['number'])
+                if partial is not None:
+                    critical_analysis['modified_critical'].append({
+                        'type': clause_type,
+                        'expected': exp_clause['text'],
+                        'actual': partial['contract_clause']['text'],
+                        'similarity': partial['similarity_score']
+                    })
+                else:
+                    # Not found at all - missing critical clause
+                    critical_analysis['missing_critical'].append({
+                        'type': clause_type,
+                        'expected': exp_clause['text']
+                    })
 
         except Exception as e:
             logger.error(f"Error in _analyze_critical_clauses: {str(e)}")
@@ -3117,36 +4020,35 @@ Make sure to extract ALL numbered sections from the document."""
 
     def _calculate_combined_score(self, similarity: float, analysis: Dict) -> float:
         """Calculate combined similarity score with analysis results."""
-        try:
-            base_score = similarity
-            
-            # Convert penalties to percentage scale
-            if analysis['structural_changes']:
-                base_score *= 0.9  # 10% penalty for structural changes
-                
-            if analysis['numeric_changes']:
-                base_score *= 0.8  # 20% penalty for numeric changes
-                
-            if analysis['content_changes']:
-                base_score *= 0.85  # 15% penalty for content changes
-                
-            # Add penalties for critical issues
-            critical_issues = (
-                len(analysis.get('critical_changes', {}).get('missing', [])) +
-                len(analysis.get('critical_changes', {}).get('modified', []))
-            )
-            if critical_issues > 0:
-                base_score *= max(0.1, 1 - (critical_issues * 0.2))  # 20% penalty per critical issue, min 10%
-            
-            # Ensure score is between 0 and 100
-            return round(max(0.0, min(100.0, base_score)), 2)
-            
-        except Exception as e:
-            logger.error(f"Error in _calculate_combined_score: {str(e)}")
-            return similarity
+        base_score = similarity
+
+        # Convert penalties to percentage scale
+        if analysis.get('structural_changes'):
+            base_score *= 0.9  # 10% penalty for structural changes
 
-    def validate_critical_clause(self, text: str) -> Dict:
-        """Validate a critical clause and return validation status."""
+        if analysis.get('numeric_changes'):
+            base_score *= 0.8  # 20% penalty for numeric changes
+
+        if analysis.get('content_changes'):
+            base_score *= 0.85  # 15% penalty for content changes
+
+        # Add penalties for critical issues
+        critical_changes = analysis.get('critical_changes') or {}
+        critical_issues = (
+            len(critical_changes.get('missing', [])) +
+            len(critical_changes.get('modified', []))
+        )
+        if critical_issues > 0:
+            base_score *= max(0.1, 1 - (critical_issues * 0.2))  # 20% penalty per critical issue, min 10%
+
+        # Ensure score is between 0 and 100
+        return round(max(0.0, min(100.0, base_score)), 2)
+
+    def validate_critical_clause(self, text: str, text_lower: Optional[str] = None) -> Dict:
+        """Validate a critical clause and return validation status.
+
+        text_lower may pass in text already lowercased by the caller.
+        """
         try:
             # Check for required elements
             validation_status = {
@@ -3155,24 +4057,26 @@ Make sure to extract ALL numbered sections from the document."""
                 'suggestions': []
             }
             
+            if text_lower is None:
+                text_lower = text.lower()
+
             # Check for missing key terms
-            key_terms = ['shall', 'must', 'will', 'agree']
-            if not any(term in text.lower() for term in key_terms):
+            if not any(term in text_lower for term in _VALIDATION_OBLIGATION_TERMS):
                 validation_status['is_valid'] = False
                 validation_status['issues'].append('Missing obligation terms')
                 validation_status['suggestions'].append('Add clear obligation terms (shall, must, will)')
             
             # Check for ambiguous language
-            ambiguous_terms = ['may', 'might', 'could', 'should']
-            if any(term in text.lower() for term in ambiguous_terms):
+            if any(term in text_lower for term in _AMBIGUOUS_TERMS):
                 validation_status['is_valid'] = False
                 validation_status['issues'].append('Contains ambiguous language')
                 validation_status['suggestions'].append('Replace ambiguous terms with definitive language')
             
             # Check for numeric values
-            if any(pattern.search(text) for pattern in self.numeric_patterns.values()):
+            # The combined alternation matches wherever any single numeric pattern does
+            if self._combined_numeric_re.search(text):
                 # Verify numeric values are clearly specified
-                if any(term in text.lower() for term in ['approximately', 'about', 'around']):
+                if any(term in text_lower for term in _IMPRECISE_QUANTITY_TERMS):
                     validation_status['is_valid'] = False
                     validation_status['issues'].append('Imprecise numeric values')
                     validation_status['suggestions'].append('Use exact numeric values')
@@ -3185,30 +4089,59 @@ Make sure to extract ALL numbered sections from the document."""
 
     def natural_sort_key(self, text: str) -> List:
         """Convert string into list of string and number chunks for natural sorting."""
-        import re
-        convert = lambda text: int(text) if text.isdigit() else text.lower()
-        return [convert(c) for c in re.split('([0-9]+)', str(text))]
+        return [int(part) if part.isdigit() else part.lower() for part in _NATURAL_SORT_RE.split(str(text))]
 
     def _get_sentence_pattern(self, sentence: str) -> str:
         """Extract basic sentence pattern/structure."""
+        return self._get_sentence_patterns([sentence])[0]
+
+    def _get_sentence_patterns(self, sentences: List[str]) -> List[str]:
+        """Sentence patterns for a batch, tagging only sentences not seen before"""
         try:
-            # Basic pattern extraction based on sentence structure
-            doc = self.nlp(sentence)
-            pattern = []
-            for token in doc:
-                if token.pos_ in ['VERB', 'NOUN', 'ADJ']:
-                    pattern.append(token.pos_)
-            return ' '.join(pattern)
+            # Patterns are collected locally: the shared memo may be cleared
+            # (here or by another thread) before this batch is returned
+            cache = self._pattern_cache
+            patterns: Dict[str, str] = {}
+            pending = []
+            for sentence in dict.fromkeys(sentences):
+                pattern = cache.get(sentence)
+                if pattern is None:
+                    pending.append(sentence)
+                else:
+                    patterns[sentence] = pattern
+            if pending:
+                # Only POS tags are needed, so skip the parser and NER components
+                disabled = [name for name in ('parser', 'ner', 'entity_ruler') if name in self.nlp.pipe_names]
+                tagged = self.nlp.pipe(
+                    ((sentence, sentence) for sentence in pending), as_tuples=True,
+                    batch_size=_SPACY_BATCH_SIZE, disable=disabled
+                )
+                for doc, sentence in tagged:
+                    # Filter the tag ids as an array instead of per Token object
+                    pos_ids = doc.to_array(POS)
+                    kept = pos_ids[np.isin(pos_ids, _PATTERN_POS_IDS)]
+                    patterns[sentence] = ' '.join(_PATTERN_POS_NAMES[pos_id] for pos_id in kept.tolist())
+                if len(cache) + len(pending) > self._pattern_cache_size:
+                    cache.clear()
+                cache.update((sentence, patterns[sentence]) for sentence in pending)
+            return [patterns[sentence] for sentence in sentences]
         except Exception as e:
-            logger.error(f"Error in _get_sentence_pattern: {str(e)}")
-            return ""
+            logger.error(f"Error in _get_sentence_patterns: {str(e)}")
+            return [""] * len(sentences)
 
     def _compare_entities(self, entities1: List[Dict], entities2: List[Dict]) -> List[Dict]:
         """Compare named entities between two texts."""
         try:
+            # Same parties throughout a contract is the common case; equal
+            # lists (compared in C, length first) cannot differ
+            if entities1 is entities2 or entities1 == entities2:
+                return []
+
             changes = []
             entities1_set = {(e.get('text', ''), e.get('label', '')) for e in entities1}
             entities2_set = {(e.get('text', ''), e.get('label', '')) for e in entities2}
+            if entities1_set == entities2_set:
+                return changes
             
             # Find missing entities
             missing = entities1_set - entities2_set
@@ -3237,52 +4170,24 @@ Make sure to extract ALL numbered sections from the document."""
 
     def _extract_legal_terms(self, text: str) -> Set[str]:
         """Extract legal terms and phrases from text."""
+        cached = self._legal_terms_cache.get(text)
+        if cached is not None:
+            return set(cached)
         try:
-            legal_terms = set()
-            doc = self.nlp(text)
-            
-            # Common legal term patterns
-            legal_patterns = {
-                'pursuant to': [
-                    'according to', 'in accordance with', 'as per',
-                    'in compliance with', 'under', 'following'
-                ],
-                'notwithstanding': [
-                    'despite', 'regardless of', 'even if', 'although',
-                    'in spite of', 'without regard to'
-                ],
-                'herein': [
-                    'in this agreement', 'in this document',
-                    'in these terms', 'contained herein'
-                ],
-                'termination': [
-                    'terminate', 'cancel', 'end', 'discontinue',
-                    'cease'
-                ],
-                'indemnification': [
-                    'indemnify', 'hold harmless', 'defend',
-                    'protect against', 'compensate'
-                ],
-                'confidentiality': [
-                    'confidential', 'proprietary', 'non-disclosure',
-                    'secret', 'private'
-                ],
-                'force majeure': [
-                    'act of god', 'unforeseen circumstance',
-                    'beyond control', 'unavoidable'
-                ]
-            }
+            entities = self._entities(text)
             
-            # Extract terms based on patterns
-            for term, synonyms in legal_patterns.items():
-                if any(syn.lower() in text.lower() for syn in [term] + synonyms):
-                    legal_terms.add(term)
+            # Extract terms whose name or a synonym occurs anywhere in the text
+            legal_terms = {
+                _LEGAL_TERM_BY_GROUP[match.lastgroup]
+                for match in _LEGAL_SYNONYM_RE.finditer(text.lower())
+            }
             
             # Extract additional legal entities
-            for ent in doc.ents:
+            for ent in entities:
                 if ent.label_ in ['LAW', 'ORG', 'GPE']:
                     legal_terms.add(ent.text)
             
+            self._remember_extraction(self._legal_terms_cache, text, frozenset(legal_terms))
             return legal_terms
             
         except Exception as e:
@@ -3295,34 +4200,67 @@ Make sure to extract ALL numbered sections from the document."""
         try:
             # Convert input to string if it's not already
             text_str = text if isinstance(text, str) else str(text)
+
+            cached = self._recall_extraction(self._obligations_cache, text_str)
+            if cached is not None:
+                return cached
+            
+            for match in self._obligation_matches(text_str):
+                obligation_text = match.group().lower()
+                # Context of this occurrence, whatever its case
+                context = self._get_span_context(text_str, *match.span())
+                obligations.append({
+                    'text': obligation_text,
+                    'context': context,
+                    'type': self._determine_obligation_type(obligation_text)
+                })
             
-            # Use class-level obligation patterns
-            for pattern in self.obligation_patterns:
-                matches = re.finditer(pattern, text_str.lower())
-                for match in matches:
-                    obligation_text = match.group()
-                    context = self._get_term_context(text_str, obligation_text)
-                    obligations.append({
-                        'text': obligation_text,
-                        'context': context,
-                        'type': self._determine_obligation_type(obligation_text)
-                    })
-            
+            self._remember_extraction(
+                self._obligations_cache, text_str, tuple(dict(obligation) for obligation in obligations)
+            )
             return obligations
             
         except Exception as e:
             logger.error(f"Error extracting obligations: {str(e)}")
             return []
 
+    def _obligation_matches(self, text: str) -> Iterator[re.Match]:
+        """Matches of every obligation pattern in text, pattern by pattern"""
+        return itertools.chain.from_iterable(pattern.finditer(text) for pattern in self._obligation_res)
+
+    def _obligation_signature(self, text: str) -> Tuple[str, ...]:
+        """Sorted obligation phrases of a text, used to tell whether obligations changed"""
+        text_str = text if isinstance(text, str) else str(text)
+        signature = self._obligation_signature_cache.get(text_str)
+        if signature is None:
+            signature = tuple(sorted(
+                match.group().lower() for match in self._obligation_matches(text_str)
+            ))
+            self._remember_extraction(self._obligation_signature_cache, text_str, signature)
+        return signature
+
+    def _recall_extraction(self, cache: Dict, text: str) -> Optional[List[Dict]]:
+        """Fresh copies of a remembered list-of-dicts extraction, or None"""
+        cached = cache.get(text)
+        if cached is None:
+            return None
+        return [dict(item) for item in cached]
+
+    def _remember_extraction(self, cache: Dict, text: str, value) -> None:
+        """Store a per-text extraction result, clearing the memo when full"""
+        if len(cache) >= self._extraction_cache_size:
+            cache.clear()
+        cache[text] = value
+
     def _determine_obligation_type(self, text: str) -> str:
         """Determine the type of obligation"""
         text_lower = text.lower()
         
-        if any(term in text_lower for term in ['shall', 'must', 'will']):
+        if any(term in text_lower for term in _MANDATORY_TERMS):
             return 'mandatory'
-        elif any(term in text_lower for term in ['may', 'can', 'permitted']):
+        elif any(term in text_lower for term in _PERMISSIVE_TERMS):
             return 'permissive'
-        elif any(term in text_lower for term in ['should', 'recommended']):
+        elif any(term in text_lower for term in _RECOMMENDED_TERMS):
             return 'recommended'
         else:
             return 'other'
@@ -3355,16 +4293,21 @@ Make sure to extract ALL numbered sections from the document."""
             
             # Analyze specific differences
             differences = []
-            
-            # Check for numeric changes
-            numeric_changes = self._extract_numeric_changes(expected_clause['text'], contract_clause['text'])
-            if numeric_changes:
-                differences.extend(numeric_changes)
-            
-            # Check for key term changes
-            term_changes = self._analyze_key_terms(expected_clause['text'], contract_clause['text'])
-            if term_changes:
-                differences.extend(term_changes)
+            expected_text = expected_clause['text']
+            contract_text = contract_clause['text']
+            
+            # Identical clause texts cannot differ in numbers or key terms;
+            # an Exact score alone does not rule out a changed amount
+            if expected_text != contract_text:
+                # Check for numeric changes
+                numeric_changes = self._extract_numeric_changes(expected_text, contract_text)
+                if numeric_changes:
+                    differences.extend(numeric_changes)
+                
+                # Check for key term changes
+                term_changes = self._analyze_key_terms(expected_text, contract_text)
+                if term_changes:
+                    differences.extend(term_changes)
             
             # Check for structural changes
             if len(comparison['differences']['added']) > 0 or len(comparison['differences']['removed']) > 0:
@@ -3406,25 +4349,18 @@ Make sure to extract ALL numbered sections from the document."""
         """Extract and compare numeric values between texts"""
         changes = []
         
-        # Define patterns for different numeric types
-        patterns = {
-            'amount': r'\$\d+(?:,\d{3})*(?:\.\d{2})?',
-            'percentage': r'\d+(?:\.\d+)?%',
-            'duration': r'\d+\s*(?:day|week|month|year)s?',
-            'time': r'\d{1,2}:\d{2}\s*(?:am|pm)',
-        }
-        
-        for value_type, pattern in patterns.items():
-            values1 = set(re.findall(pattern, text1, re.IGNORECASE))
-            values2 = set(re.findall(pattern, text2, re.IGNORECASE))
+        for value_type, pattern in _NUMERIC_CHANGE_PATTERNS:
+            # Deduplicated in order of appearance so reported lists are stable
+            values1 = dict.fromkeys(pattern.findall(text1))
+            values2 = dict.fromkeys(pattern.findall(text2))
             
-            if values1 != values2:
+            if values1.keys() != values2.keys():
                 changes.append({
                     'type': 'numeric',
                     'value_type': value_type,
                     'expected': list(values1),
                     'found': list(values2),
-                    'severity': 'High' if value_type in ['amount', 'percentage'] else 'Medium'
+                    'severity': 'High' if value_type in _HIGH_SEVERITY_VALUE_TYPES else 'Medium'
                 })
         
         return changes
@@ -3433,20 +4369,13 @@ Make sure to extract ALL numbered sections from the document."""
         """Analyze changes in key legal and business terms"""
         changes = []
         
-        # Define key terms to check
-        key_terms = {
-            'obligation': ['shall', 'must', 'will', 'agrees to'],
-            'prohibition': ['shall not', 'must not', 'will not', 'may not'],
-            'permission': ['may', 'is permitted to', 'is allowed to'],
-            'condition': ['if', 'provided that', 'subject to', 'conditional upon'],
-            'time': ['immediately', 'promptly', 'within', 'by'],
-        }
-        
-        for term_type, terms in key_terms.items():
+        text1_lower = text1.lower()
+        text2_lower = text2.lower()
+        for term_type, terms in _KEY_TERMS:
             # Check each term's presence/absence
             for term in terms:
-                in_text1 = term.lower() in text1.lower()
-                in_text2 = term.lower() in text2.lower()
+                in_text1 = term in text1_lower
+                in_text2 = term in text2_lower
                 
                 if in_text1 != in_text2:
                     changes.append({
@@ -3454,7 +4383,7 @@ Make sure to extract ALL numbered sections from the document."""
                         'term_type': term_type,
                         'term': term,
                         'change': 'removed' if in_text1 else 'added',
-                        'severity': 'High' if term_type in ['obligation', 'prohibition'] else 'Medium'
+                        'severity': 'High' if term_type in _HIGH_SEVERITY_TERM_TYPES else 'Medium'
                     })
         
         return changes
@@ -3462,27 +4391,45 @@ Make sure to extract ALL numbered sections from the document."""
     def _identify_critical_changes(self, text1: str, text2: str) -> Dict:
         """Identify changes in critical clauses"""
         try:
-            # Get critical clauses from both texts
+            # Get critical clauses from both texts; with none expected there
+            # is nothing to miss or modify, so text2 need not be scanned
             critical1 = self._extract_critical_clauses(text1)
+            if not critical1:
+                return {'missing': [], 'modified': [], 'matched': []}
             critical2 = self._extract_critical_clauses(text2)
             
+            # Candidates are only ever clauses of the same type
+            critical2_by_type = defaultdict(list)
+            for j, clause2 in enumerate(critical2):
+                critical2_by_type[clause2['type']].append((j, clause2))
+            
+            # Encode every critical clause in one batch and score all
+            # candidate pairs with a single matrix product
+            semantic_scores = None
+            if any(clause1['type'] in critical2_by_type for clause1 in critical1):
+                embeddings = self._encode_batch(
+                    [' '.join(clause['text'].split()) for clause in critical1 + critical2]
+                )
+                semantic_scores = (embeddings[:len(critical1)] @ embeddings[len(critical1):].T) * 100
+            
             missing = []
             modified = []
             matched = []
             
             # Check for missing and modified critical clauses
-            for clause1 in critical1:
+            for i, clause1 in enumerate(critical1):
                 found_match = False
                 best_match = None
                 best_score = 0
                 
-                for clause2 in critical2:
-                    if clause1['type'] == clause2['type']:
-                        # Calculate similarity between clauses
-                        similarity = self.calculate_similarity_score(clause1['text'], clause2['text'])
-                        if similarity > best_score:
-                            best_score = similarity
-                            best_match = clause2
+                for j, clause2 in critical2_by_type.get(clause1['type'], ()):
+                    # Calculate similarity between clauses
+                    similarity = self.calculate_similarity_score(
+                        clause1['text'], clause2['text'], semantic_score=float(semantic_scores[i, j])
+                    )
+                    if similarity > best_score:
+                        best_score = similarity
+                        best_match = clause2
                 
                 if best_score >= 90:  # High similarity threshold for critical clauses
                     matched.append({
@@ -3519,42 +4466,16 @@ Make sure to extract ALL numbered sections from the document."""
 
     def _extract_critical_clauses(self, text: str) -> List[Dict]:
         """Extract critical clauses from text"""
-        critical_clauses = []
+        cached = self._recall_extraction(self._critical_clauses_cache, text)
+        if cached is not None:
+            return cached
         
-        # Define critical clause patterns with their types
-        critical_patterns = {
-            'termination': [
-                r'(?:right|ability)\s+to\s+terminate',
-                r'termination\s+(?:for|with)\s+cause',
-                r'immediate\s+termination'
-            ],
-            'liability': [
-                r'limitation\s+of\s+liability',
-                r'liability\s+cap',
-                r'indemnification'
-            ],
-            'payment': [
-                r'payment\s+terms?',
-                r'fee\s+structure',
-                r'pricing'
-            ],
-            'confidentiality': [
-                r'confidential\s+information',
-                r'non[-\s]?disclosure',
-                r'trade\s+secrets?'
-            ],
-            'intellectual_property': [
-                r'intellectual\s+property',
-                r'ip\s+rights?',
-                r'ownership\s+of\s+(?:work|materials|deliverables)'
-            ]
-        }
+        critical_clauses = []
         
         # Extract critical clauses
-        for clause_type, patterns in critical_patterns.items():
+        for clause_type, patterns in _CRITICAL_CLAUSE_PATTERNS:
             for pattern in patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
-                for match in matches:
+                for match in pattern.finditer(text):
                     # Get surrounding context
                     start = max(0, match.start() - 100)
                     end = min(len(text), match.end() + 100)
@@ -3566,6 +4487,9 @@ Make sure to extract ALL numbered sections from the document."""
                         'position': match.start()
                     })
         
+        self._remember_extraction(
+            self._critical_clauses_cache, text, tuple(dict(clause) for clause in critical_clauses)
+        )
         return critical_clauses
 
     def _analyze_differences(self, text1: str, text2: str) -> Dict:
@@ -3721,13 +4645,9 @@ Make sure to extract ALL numbered sections from the document."""
         """Analyze changes in obligations"""
         changes = []
         try:
+            texts2 = {obl2['text'] for obl2 in obligations2}
             for obl1 in obligations1:
-                found_match = False
-                for obl2 in obligations2:
-                    if obl1['text'] == obl2['text']:
-                        found_match = True
-                        break
-                if not found_match:
+                if obl1['text'] not in texts2:
                     changes.append({
                         'type': 'obligation',
                         'description': 'Modified obligation',
@@ -3739,92 +4659,76 @@ Make sure to extract ALL numbered sections from the document."""
             logging.error(f"Error in _analyze_obligation_changes: {str(e)}")
             return changes
 
-    def _calculate_component_scores(self, matches: List[Dict], partial_matches: List[Dict]) -> Dict[str, float]:
-        """Calculate component-wise scores across all matches"""
-        total_legal = []
-        total_numeric = []
-        total_obligations = []
-        total_semantic = []
+    def _match_score_features(self, matches: List[Dict]) -> np.ndarray:
+        """Raw score features of each match as an (N, 6) array.
+
+        Columns: has a similarity score, changed legal terms, total legal
+        terms, numeric changes, obligation changes and similarity score.
+        """
+        features = np.zeros((len(matches), 6), dtype=np.float64)
+        for row, match in zip(features, matches):
+            differences = match.get('differences') or {}
+            legal_terms = differences.get('legal_terms') or {}
+            changed = len(legal_terms.get('modified', ())) + len(legal_terms.get('removed', ()))
+            row[:] = (
+                'similarity_score' in match,
+                changed,
+                changed + len(legal_terms.get('matches', ())),
+                len(differences.get('numeric_values', ())),
+                len(differences.get('obligations', ())),
+                match.get('similarity_score', 0.0)
+            )
+        return features
+
+    def _component_scores_from_features(self, features: np.ndarray) -> Dict[str, float]:
+        """Average component scores over the scored rows of a feature array"""
+        scored = features[features[:, 0] > 0]
+        if not len(scored):
+            return dict.fromkeys(_COMPONENT_SCORE_NAMES, 0.0)
         
-        # Process both matches and partial matches
-        for match in matches + partial_matches:
-            if 'similarity_score' in match:
-                # Extract component scores if available
-                differences = match.get('differences', {})
-                
-                # Legal terms score - based on proportion of unchanged terms
-                legal_terms = differences.get('legal_terms', {})
-                modified = len(legal_terms.get('modified', []))
-                removed = len(legal_terms.get('removed', []))
-                total = modified + removed + len(legal_terms.get('matches', []))
-                if total == 0:
-                    total_legal.append(100.0)  # No legal terms in either text
-                else:
-                    score = (1 - ((modified + removed) / total)) * 100
-                    total_legal.append(max(0, score))
-                
-                # Numeric values score - based on proportion of unchanged values
-                numeric_changes = differences.get('numeric_values', [])
-                if not numeric_changes:
-                    total_numeric.append(100.0)
-                else:
-                    score = max(0, 100 - (len(numeric_changes) * 20))  # -20% per change
-                    total_numeric.append(score)
-                
-                # Obligations score - based on proportion of unchanged obligations
-                obligations = differences.get('obligations', [])
-                if not obligations:
-                    total_obligations.append(100.0)
-                else:
-                    score = max(0, 100 - (len(obligations) * 25))  # -25% per change
-                    total_obligations.append(score)
-                
-                # Semantic score (from similarity score)
-                total_semantic.append(match.get('similarity_score', 0.0))
+        changed, total, numeric_counts, obligation_counts, semantic = scored[:, 1:].T
         
-        # Calculate averages, handling empty lists
-        def safe_average(lst):
-            return sum(lst) / len(lst) if lst else 0.0
+        # One column per component score, averaged in a single reduction
+        scores = np.empty((len(scored), len(_COMPONENT_SCORE_NAMES)))
+        # Legal terms score - proportion of unchanged terms, 100 when neither text has any
+        scores[:, 0] = np.where(total > 0, np.maximum(0.0, (1 - changed / np.maximum(total, 1)) * 100), 100.0)
+        # Numeric values score - 20% off per change
+        scores[:, 1] = np.maximum(0.0, 100 - numeric_counts * 20)
+        # Obligations score - 25% off per change
+        scores[:, 2] = np.maximum(0.0, 100 - obligation_counts * 25)
+        scores[:, 3] = semantic
         
         return {
-            'legal_term_score': round(safe_average(total_legal), 2),
-            'numeric_score': round(safe_average(total_numeric), 2),
-            'obligation_score': round(safe_average(total_obligations), 2),
-            'semantic_score': round(safe_average(total_semantic), 2)
+            name: round(mean, 2)
+            for name, mean in zip(_COMPONENT_SCORE_NAMES, scores.mean(axis=0).tolist())
         }
 
+    def _calculate_component_scores(self, matches: List[Dict], partial_matches: List[Dict]) -> Dict[str, float]:
+        """Calculate component-wise scores across all matches"""
+        return self._component_scores_from_features(self._match_score_features(matches + partial_matches))
+
     def _calculate_final_scores(self, matches: List[Dict], partial_matches: List[Dict]) -> Dict:
         """Calculate final scores and summary"""
+        # One feature pass serves the component scores, counts and critical issues
+        features = self._match_score_features(matches + partial_matches)
+        similarity_scores = features[:, 5]
+        
         # Calculate component scores
-        component_scores = self._calculate_component_scores(matches, partial_matches)
-        
-        # Calculate overall similarity score with weights
-        weights = {
-            'legal_term_score': 0.35,  # Legal terms have highest weight
-            'numeric_score': 0.25,     # Numeric values and obligations equally important
-            'obligation_score': 0.25,
-            'semantic_score': 0.15     # Semantic similarity has lowest weight
-        }
+        component_scores = self._component_scores_from_features(features)
         
-        # Calculate base similarity score
-        similarity_score = (
-            component_scores['legal_term_score'] * weights['legal_term_score'] +
-            component_scores['numeric_score'] * weights['numeric_score'] +
-            component_scores['obligation_score'] * weights['obligation_score'] +
-            component_scores['semantic_score'] * weights['semantic_score']
+        # Calculate base similarity score with weights
+        similarity_score = float(
+            np.fromiter((component_scores[name] for name in _COMPONENT_SCORE_NAMES), dtype=np.float64)
+            @ _COMPONENT_SCORE_WEIGHTS
         )
         
         # Count matches by type
-        match_count = len([m for m in matches if m.get('similarity_score', 0) >= 95])
-        partial_match_count = len([m for m in partial_matches if m.get('similarity_score', 0) >= 80])
+        match_count = int(np.count_nonzero(similarity_scores[:len(matches)] >= 95))
+        partial_match_count = int(np.count_nonzero(similarity_scores[len(matches):] >= 80))
         mismatch_count = len(matches) + len(partial_matches) - match_count - partial_match_count
         
         # Calculate critical issues
-        critical_issues = 0
-        for match in matches + partial_matches:
-            differences = match.get('differences', {})
-            legal_terms = differences.get('legal_terms', {})
-            critical_issues += len(legal_terms.get('modified', [])) + len(legal_terms.get('removed', []))
+        critical_issues = int(features[:, 1].sum())
         
         # Apply critical issues penalty (max 50% reduction)
         if critical_issues > 0:
@@ -3873,8 +4777,8 @@ Make sure to extract ALL numbered sections from the document."""
     def compare_clauses(self, expected_clause: Dict, contract_clause: Dict) -> Dict:
         """Compare individual clauses and return detailed analysis"""
         try:
-            # Calculate similarity scores
-            similarity = self._calculate_similarity(expected_clause['text'], contract_clause['text'])
+            # Calculate similarity scores through the memoized comparison path
+            similarity = self.compare_texts(expected_clause['text'], contract_clause['text'])['similarity_score']
             differences = self._analyze_clause_differences(expected_clause, contract_clause)
             
             # Determine match category
@@ -3929,36 +4833,29 @@ Make sure to extract ALL numbered sections from the document."""
             # Compare and get differences
             differences = []
             
+            keys1 = {(value1['value'], value1['type']) for value1 in numeric_values1}
+            keys2 = {(value2['value'], value2['type']) for value2 in numeric_values2}
+            
             # Check for values in text1 not in text2
             for value1 in numeric_values1:
-                found_match = False
-                for value2 in numeric_values2:
-                    if value1['value'] == value2['value'] and value1['type'] == value2['type']:
-                        found_match = True
-                        break
-                if not found_match:
+                if (value1['value'], value1['type']) not in keys2:
                     differences.append({
                         'type': 'removed',
                         'value': value1['value'],
                         'value_type': value1['type'],
                         'context': value1.get('context', ''),
-                        'severity': 'High' if value1['type'] in ['amount', 'percentage'] else 'Medium'
+                        'severity': 'High' if value1['type'] in _HIGH_SEVERITY_VALUE_TYPES else 'Medium'
                     })
             
             # Check for values in text2 not in text1
             for value2 in numeric_values2:
-                found_match = False
-                for value1 in numeric_values1:
-                    if value2['value'] == value1['value'] and value2['type'] == value1['type']:
-                        found_match = True
-                        break
-                if not found_match:
+                if (value2['value'], value2['type']) not in keys1:
                     differences.append({
                         'type': 'added',
                         'value': value2['value'],
                         'value_type': value2['type'],
                         'context': value2.get('context', ''),
-                        'severity': 'High' if value2['type'] in ['amount', 'percentage'] else 'Medium'
+                        'severity': 'High' if value2['type'] in _HIGH_SEVERITY_VALUE_TYPES else 'Medium'
                     })
             
             return differences
@@ -3976,27 +4873,29 @@ Make sure to extract ALL numbered sections from the document."""
             obligations1 = self._extract_obligations(text1)
             obligations2 = self._extract_obligations(text2)
             
+            # First obligation in text2 for each obligation text
+            by_text2 = {}
+            for obl2 in obligations2:
+                by_text2.setdefault(obl2['text'], obl2)
+            
             # Track matched obligations to identify additions/removals
             matched_obligations = set()
             
             # Compare each obligation from text1 with text2
             for obl1 in obligations1:
-                found_match = False
-                for obl2 in obligations2:
-                    if obl1['text'] == obl2['text']:
-                        found_match = True
-                        matched_obligations.add(obl2['text'])
-                        # Check for context changes
-                        if obl1['context'] != obl2['context']:
-                            differences.append({
-                                'type': 'modified',
-                                'obligation': obl1['text'],
-                                'original_context': obl1['context'],
-                                'new_context': obl2['context']
-                            })
-                        break
-                
-                if not found_match:
+                obl2 = by_text2.get(obl1['text'])
+                if obl2 is not None:
+                    matched_obligations.add(obl2['text'])
+                    # Check for context changes; obligations are matched
+                    # case-insensitively, so their contexts are too
+                    if obl1['context'].lower() != obl2['context'].lower():
+                        differences.append({
+                            'type': 'modified',
+                            'obligation': obl1['text'],
+                            'original_context': obl1['context'],
+                            'new_context': obl2['context']
+                        })
+                else:
                     differences.append({
                         'type': 'removed',
                         'obligation': obl1['text'],
@@ -0,0 +1,80 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nlp import ContractAnalyzer
+
+
+@pytest.fixture(scope='module')
+def analyzer():
+    return ContractAnalyzer()
+
+
+def test_legal_terms_only_count_whole_words(analyzer):
+    # 'sign' in "signature", 'effect' in "effective" and 'end' in "vendor"
+    # are substrings only and must not count as legal terms
+    text = ('The vendor shall pay the fee within 30 days of signature '
+            'and the agreement is effective immediately.')
+    assert analyzer._calculate_legal_term_similarity(text, text) == 100.0
+
+
+def test_sentence_patterns_survive_memo_reset(analyzer):
+    sentences = ['The tenant pays rent.', 'The landlord repairs the roof.', 'Either party may terminate.']
+    size = analyzer._pattern_cache_size
+    analyzer._pattern_cache.clear()
+    analyzer._pattern_cache_size = 3
+    try:
+        first = analyzer._get_sentence_patterns(sentences)
+        # The new sentence overflows the memo; the cached one must still be returned
+        second = analyzer._get_sentence_patterns([sentences[0], 'The buyer signs the deed.'])
+    finally:
+        analyzer._pattern_cache_size = size
+        analyzer._pattern_cache.clear()
+    assert first[0]
+    assert second[0] == first[0]
+    assert second[1]
+
+
+@pytest.mark.parametrize('text', [
+    'Membership rights shall transfer',
+    'The relationship ownership is shared',
+    'The ship protection plan applies',
+    'Buyer takes ownership of iPads',
+])
+def test_acronym_patterns_need_whole_words(analyzer, text):
+    # IP/IPR/ADR are matched case-insensitively and must not fire inside words
+    assert analyzer.is_critical_clause(text) == (False, '', '')
+
+
+def test_ip_rights_clause_is_critical(analyzer):
+    is_critical, clause_type, importance = analyzer.is_critical_clause('The IP rights vest in the Client')
+    assert is_critical
+    assert 'intellectual_property' in clause_type.split('|')
+    assert importance == 'High'
+
+
+def test_obligation_context_ignores_case(analyzer):
+    obligations = analyzer._extract_obligations('The Supplier Shall deliver the goods.')
+    assert obligations[0]['text'] == 'shall deliver'
+    assert obligations[0]['context'] == 'The Supplier Shall deliver the goods.'
+    assert analyzer._get_obligation_differences(
+        'The Supplier shall pay the fee.', 'The Supplier Shall pay the fee.'
+    ) == []
+
+
+def test_repeated_obligation_uses_its_own_context(analyzer):
+    text = 'Buyer shall pay the deposit now. After delivery the Buyer shall pay the balance.'
+    contexts = [obligation['context'] for obligation in analyzer._extract_obligations(text)]
+    assert len(contexts) == 2
+    assert 'balance' in contexts[1] and 'balance' not in contexts[0]
+
+
+def test_close_releases_worker_pool():
+    analyzer = ContractAnalyzer()
+    analyzer.close()
+    with pytest.raises(RuntimeError):
+        analyzer._clause_executor.submit(len, '')
+    analyzer.close()  # closing twice is harmless